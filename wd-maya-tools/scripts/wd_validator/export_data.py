@@ -15,8 +15,10 @@ import maya.mel as mel
 
 from wd_validator import static, utilities
 
-importlib.reload(static)
-importlib.reload(utilities)
+# Reloading is only needed while developing the add-on
+if os.environ.get('WD_VALIDATOR_DEV'):
+    importlib.reload(static)
+    importlib.reload(utilities)
 
 # Code should be Python27 compatible
 # pylint: disable=consider-using-f-string
@@ -94,14 +96,14 @@ def fix_blendshapes(scene_data):
 
             # Fix inputs in all blendshapes
             for blendshape in blendshapes:
-                mesh_list = cmds.listConnections(blendshape + '.inputTarget')
+                mesh_list = cmds.listConnections(blendshape + '.inputTarget', source=True, destination=False)
 
                 for mesh in mesh_list or []:
                     src_conn = mesh + '.inMesh'
 
                     # history connected to in mesh (should be either 1 if there are history
                     # or 0 if there are no history connected)
-                    conns_in_mesh = cmds.listConnections(mesh + '.inMesh', p=1)
+                    conns_in_mesh = cmds.listConnections(mesh + '.inMesh', p=1, source=True, destination=False)
                     for conn in conns_in_mesh or []:
                         cmds.disconnectAttr(conn, src_conn)
 
@@ -283,11 +285,18 @@ def export_textures(scene_data):
         scene_data (CollectExportData): the scene data object initialized with materials.
     """
     materials_list = []
+    copied_textures = set()
+
+    def _copy_new_textures(textures):
+        # materials sharing textures only need them copied once
+        new_textures = [tex for tex in textures if tex not in copied_textures]
+        copied_textures.update(new_textures)
+        utilities.copy_textures(new_textures, scene_data.export_dir)
 
     for material in scene_data.materials:
         mat_dict = {}
 
-        material_type = cmds.nodeType(material)
+        material_type = scene_data.node_type(material)
 
         if material_type in ['aiStandardSurface', 'standardSurface']:
             type_ = 'surface'
@@ -310,7 +319,7 @@ def export_textures(scene_data):
                 if attr_textures:
                     tex_name = utilities.make_extension_lowercase(os.path.split(attr_textures[0])[-1])
                     mat_dict[key_names[1]] = tex_name
-                    utilities.copy_textures(attr_textures, scene_data.export_dir)
+                    _copy_new_textures(attr_textures)
 
                 else:
                     mat_dict[key_names[1]] = None
@@ -323,7 +332,7 @@ def export_textures(scene_data):
                 if attr_textures:
                     tex_name = utilities.make_extension_lowercase(os.path.split(attr_textures[0])[-1])
                     mat_dict[key_names[1]] = tex_name
-                    utilities.copy_textures(attr_textures, scene_data.export_dir)
+                    _copy_new_textures(attr_textures)
 
                 else:
                     mat_dict[key_names[1]] = None
@@ -343,22 +352,24 @@ def export_groom(scene_data):
     """
     print('\n>>> Exporting xGen groom...\n')
 
-    ig_spline_bases = cmds.ls(type='xgmSplineBase') or None
+    ig_spline_bases = scene_data.scene_nodes.get('xgmSplineBase') or []
     all_interactive_grooms = []
     all_materials = {}
 
     i = 1
 
     for spline_base in ig_spline_bases:
-        scalp_geo = cmds.listConnections(spline_base + '.boundMesh')[0]
+        scalp_geo = cmds.listConnections(spline_base + '.boundMesh', source=True, destination=False)[0]
 
         if scalp_geo:
             interactive_groom_shape = utilities.get_spline_description(spline_base)
             interactive_groom = cmds.listRelatives(interactive_groom_shape, parent=True)[0]
             interactive_groom_sg = cmds.listConnections(
-                '{}.instObjGroups'.format(interactive_groom_shape), type='shadingEngine'
+                '{}.instObjGroups'.format(interactive_groom_shape), type='shadingEngine', source=False, destination=True
+            )[0]
+            material = cmds.listConnections(
+                '{}.surfaceShader'.format(interactive_groom_sg), source=True, destination=False
             )[0]
-            material = cmds.listConnections('{}.surfaceShader'.format(interactive_groom_sg))[0]
 
             new_name = '{mesh}_groom{id}_sd'.format(id=str(i), mesh=scalp_geo)
 
@@ -6,6 +6,7 @@
 """Module for the Eye Rotations UI."""
 
 import importlib
+import os
 import webbrowser
 from functools import partial
 
@@ -13,8 +14,10 @@ import maya.cmds as cmds
 
 from wd_validator import static, utilities
 
-importlib.reload(static)
-importlib.reload(utilities)
+# Reloading is only needed while developing the add-on
+if os.environ.get('WD_VALIDATOR_DEV'):
+    importlib.reload(static)
+    importlib.reload(utilities)
 
 
 # Maya mel interface will add arguments to callbacks in ui widgets
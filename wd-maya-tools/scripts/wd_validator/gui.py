@@ -9,6 +9,7 @@ from functools import partial
 import functools
 import webbrowser
 import importlib
+import os
 from datetime import datetime
 
 import maya.cmds as cmds
@@ -16,15 +17,17 @@ import maya.cmds as cmds
 from wd_validator import static, utilities, validation_main as validate, validation_fixes as val_fix
 from wd_validator import validation_tools, export_data, rig_retargeting_gui, eye_rotations_gui, script_output_window
 
-importlib.reload(static)
-importlib.reload(utilities)
-importlib.reload(validate)
-importlib.reload(val_fix)
-importlib.reload(validation_tools)
-importlib.reload(export_data)
-importlib.reload(rig_retargeting_gui)
-importlib.reload(eye_rotations_gui)
-importlib.reload(script_output_window)
+# Reloading is only needed while developing the add-on
+if os.environ.get('WD_VALIDATOR_DEV'):
+    importlib.reload(static)
+    importlib.reload(utilities)
+    importlib.reload(validate)
+    importlib.reload(val_fix)
+    importlib.reload(validation_tools)
+    importlib.reload(export_data)
+    importlib.reload(rig_retargeting_gui)
+    importlib.reload(eye_rotations_gui)
+    importlib.reload(script_output_window)
 
 
 # Maya mel interface will add arguments to callbacks in ui widgets
@@ -46,12 +49,16 @@ class ValidationUI(object):
         self.retarget_ui = None
         self.eye_rotations_ui = None
         self.script_terminal = None
+        self.validation_queued = False
 
         self.window = 'character_validation'
         self.title = 'Character Validation and Export'
         self.width = 515
 
-        self.all_output_messages = ''
+        # formatted messages are kept as separate chunks, growing a single string copies it every time
+        self.all_output_messages = []
+        self.output_batch_depth = 0
+        self.output_batch_lines = []
 
         if cmds.window(self.window, exists=True):
             cmds.deleteUI(self.window, window=True)
@@ -69,6 +76,8 @@ class ValidationUI(object):
         # window_size = (self.width, self.width * 1.29)
         window_size = (self.width, self.width * 1.36)
         self.window = cmds.window(self.window, title=self.title, widthHeight=window_size, sizeable=True)
+        # the scene callbacks are removed however the window gets deleted, including its title bar button
+        cmds.scriptJob(uiDeleted=[self.window, self.scene_data.remove_callbacks])
 
         # Main layout
         self.main_column = cmds.columnLayout(adjustableColumn=True)
@@ -87,10 +96,10 @@ class ValidationUI(object):
         # Script controls
         controls_form = cmds.formLayout(numberOfDivisions=100)
 
-        self.validate_button = cmds.button(label='Refresh Validation', command=self.start_validation)
+        self.validate_button = cmds.button(label='Refresh Validation', command=self.queue_validation)
 
         checkbox_annotation = 'Enable USD support to use all USD,\nMaya and Unreal export features in\nWonder Studio.'
-        self.validate_usd_checkbox = cmds.checkBox(label='Enable USD Support: Required for USD, Maya and Unreal Engine export.', v=0, changeCommand=self.start_validation,
+        self.validate_usd_checkbox = cmds.checkBox(label='Enable USD Support: Required for USD, Maya and Unreal Engine export.', v=0, changeCommand=self.queue_validation,
                                                    annotation=checkbox_annotation)
     
         separator_val = cmds.separator()
@@ -212,6 +221,8 @@ class ValidationUI(object):
         if cmds.window(self.window, exists=True):
             cmds.deleteUI(self.window, window=True)
 
+        self.scene_data.remove_callbacks()
+
         try:
             self.retarget_ui.close_window()
         except Exception:
@@ -232,7 +243,7 @@ class ValidationUI(object):
         for k, v_data in static.validation_windows_data.items():
             form1 = cmds.formLayout(numberOfDivisions=100, height=25, width=200)
 
-            if k.split('_')[0] == 'header':
+            if k.startswith('header_'):
                 text1 = cmds.text(label=v_data['message'], align='left', height=25, font='boldLabelFont')
                 cmds.formLayout(
                     form1,
@@ -353,6 +364,24 @@ class ValidationUI(object):
         validate.validation_run(self.scene_data, mode=mode)
         self.enable_export()
 
+    def queue_validation(self, *args):
+        """Callback for the UI controls that request a validation. The validation runs
+        once Maya is idle, so all the requests made meanwhile (eg. toggling the USD
+        checkbox several times in a row) are collapsed into a single run.
+        """
+        if self.validation_queued:
+            return
+
+        self.validation_queued = True
+        cmds.evalDeferred(self.run_queued_validation)
+
+    def run_queued_validation(self):
+        """Runs the validation that was queued by queue_validation."""
+        self.validation_queued = False
+
+        if cmds.window(self.window, exists=True):
+            self.start_validation()
+
     def fix_button(self, val_type, *args):
         """Callback called by validation buttons when fix is available. This will
         fix the scene and save it. Then it will update the enable status of the export
@@ -395,7 +424,7 @@ class ValidationUI(object):
             status (str): The current status of the validator, it can be 'fix', 'pass', 'fail',
                 'skip' and 'warning'.
         """
-        if val_type.split('_')[0] != 'header':
+        if not val_type.startswith('header_'):
             status_button = self.validation_windows[val_type]['button']
             enable_status = True
 
@@ -543,6 +572,20 @@ class ValidationUI(object):
             self.update_status(val_type='face_check', status='skip')
             self.scene_data.face_geo = None
 
+    def format_script_output(self, message, current_time):
+        """Builds the text that is stored in the global list of messages for a message.
+        Args:
+            message (str or list[str]): The message(s) to format.
+            current_time (str): The time stamp to prefix each line with.
+        Returns:
+            str: The formatted text.
+        """
+        if isinstance(message, list):
+            msg = ''.join('[' + current_time + '] ' + msg_line + '\n' for msg_line in message)
+            return '\n' + msg if message else msg
+
+        return '\n' + '[' + current_time + '] ' + message + '\n'
+
     def update_script_output(self, message):
         """Add the message or list of messages to the global list of messages.
         It also prints this messages to the script editor and update them in
@@ -550,38 +593,72 @@ class ValidationUI(object):
         Args:
             message (str or list[str]): The message(s) to display for the user.
         """
+        self.update_script_outputs([message])
+
+    def update_script_outputs(self, messages):
+        """Adds several messages to the global list of messages at once, printing them
+        to the script editor and updating the Terminal UI a single time.
+        Args:
+            messages (list[str or list[str]]): The messages to display for the user.
+        """
         now = datetime.now()
         current_time = now.strftime("%H:%M:%S")
 
-        if isinstance(message, list):
-            for i, msg_line in enumerate(message):
-                msg = '[' + current_time + '] ' + msg_line + '\n'
+        for message in messages:
+            self.all_output_messages.append(self.format_script_output(message, current_time))
+            self.output_batch_lines += message if isinstance(message, list) else [message]
 
-                if i == 0:
-                    msg = '\n' + msg
+        if not self.output_batch_depth:
+            self.write_script_outputs()
 
-                self.all_output_messages += msg
-                print(msg_line)
+    def begin_output_batch(self):
+        """Starts batching the output messages. Until the matching flush_output_batch
+        call, messages are only stored and are printed together when flushed.
+        Batches can be nested, only the outermost one writes the messages.
+        """
+        self.output_batch_depth += 1
 
-        else:
-            msg = '\n' + '[' + current_time + '] ' + message + '\n'
-            self.all_output_messages += msg
-            print(message)
+    def flush_output_batch(self):
+        """Ends the current output batch, writing the stored messages if it was
+        the outermost one.
+        """
+        self.output_batch_depth = max(self.output_batch_depth - 1, 0)
+
+        if not self.output_batch_depth:
+            self.write_script_outputs()
+
+    def write_script_outputs(self):
+        """Prints the messages not written yet to the script editor and updates
+        the Terminal UI if it is open.
+        """
+        if self.output_batch_lines:
+            print('\n'.join(self.output_batch_lines))
+            self.output_batch_lines = []
 
         if cmds.window('script_terminal_window', exists=True):
             self.script_terminal.update_terminal()
 
+    def bulk_update(self, results):
+        """Updates the status of several validators and outputs their messages with the
+        UI refresh suspended, so the window is redrawn once for all of them.
+        Args:
+            results (list[tuple(str, str, str or list[str])]): the validator name, its status
+                and its message for each validator to update.
+        """
+        with utilities.FastMayaContext(undo_chunk=False, pause_evaluation=False, suspend_refresh=True):
+            for val_type, status, _ in results:
+                self.update_status(val_type=val_type, status=status)
+
+            self.update_script_outputs([message for _, _, message in results])
+
     def enable_export(self):
         """Sets the enable state of the export buttons based on whether or not
         all the validators have an accepted status. This enable state is also
         cached in a member variable.
         """
-        accepted_statuses = ['pass', 'skip', 'warning', 'warning_fix']
-        self.export_enable = True
-
-        for val in self.validation_windows.values():
-            if val['status'] not in accepted_statuses:
-                self.export_enable = False
+        self.export_enable = all(
+            val['status'] in static.EXPORT_ACCEPTED_STATUSES for val in self.validation_windows.values()
+        )
 
         if self.export_enable:
             export_char = True
@@ -6,12 +6,15 @@
 """Entry point for the Validation add-on."""
 
 import importlib
+import os
 
 from wd_validator import gui, scene_data_collection, validation_main
 
-importlib.reload(gui)
-importlib.reload(scene_data_collection)
-importlib.reload(validation_main)
+# Reloading is only needed while developing the add-on
+if os.environ.get('WD_VALIDATOR_DEV'):
+    importlib.reload(gui)
+    importlib.reload(scene_data_collection)
+    importlib.reload(validation_main)
 
 
 def run():
@@ -9,6 +9,7 @@ scene to bones in the expected skeleton for the Wonder Studio Character.
 
 import copy
 import importlib
+import os
 import webbrowser
 from functools import partial
 
@@ -16,9 +17,11 @@ import maya.cmds as cmds
 
 from wd_validator import static, utilities, validation_tools as validate
 
-importlib.reload(static)
-importlib.reload(utilities)
-importlib.reload(validate)
+# Reloading is only needed while developing the add-on
+if os.environ.get('WD_VALIDATOR_DEV'):
+    importlib.reload(static)
+    importlib.reload(utilities)
+    importlib.reload(validate)
 
 # Maya mel interface will add arguments to callbacks in ui widgets
 # that you need to catch somehow
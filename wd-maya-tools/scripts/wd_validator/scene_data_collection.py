@@ -7,18 +7,31 @@
 
 import copy
 import importlib
+import os
 
 import maya.cmds as cmds
+import maya.api.OpenMaya as om
 
 from wd_validator import utilities, static
 
-importlib.reload(utilities)
-importlib.reload(static)
+# Reloading is only needed while developing the add-on
+if os.environ.get('WD_VALIDATOR_DEV'):
+    importlib.reload(utilities)
+    importlib.reload(static)
 
 
 # Code should be Python27 compatible
 # pylint: disable=consider-using-f-string
 
+# Node types listed once per collection and shared by the checks through scene_nodes
+SCENE_NODE_TYPES = ['xgmPalette', 'xgmSplineBase']
+
+# Mesh attributes read by collect_data, editing them invalidates the collected data
+COLLECTED_MESH_ATTRIBUTES = frozenset(['intermediateObject'])
+
+# Plugins providing the xGen node types, without them loaded the scene can not have xGen nodes
+XGEN_PLUGINS = ['xgenToolkit', 'xgenMR']
+
 
 class CollectExportData:
     """Class responsible for handling the scene and validation data."""
@@ -29,6 +42,8 @@ class CollectExportData:
 
         self.geo_group = None
         self.all_meshes = None
+        self.all_meshes_set = frozenset()
+        self.mesh_transforms = {}
         self.rig_selection = None
         self.rig_group = None
         self.blendshapes = []
@@ -36,26 +51,114 @@ class CollectExportData:
         self.face_blendshapes = []
         self.meshes_with_history = []
 
+        self.scene_nodes = {}
+        self.xgen_loaded = False
         self.materials = []
+        self.material_connections_messages = None
         self.file_nodes = {}
+        self.texture_file_nodes = {}
+        self.node_types = {}
+        self.descendants = {}
+        self.rig_mapping = None
         self.bump_data = {}
 
         self.validation_data = {}
         self.export_dir = None
         self.metadata_json = copy.deepcopy(static.metadata_template)
 
-    def collect_data(self):
+        self.scene_changed = True
+        # ids of the callbacks registered by this instance, other instances keep their own
+        self.callback_ids = []
+        self.attribute_callback_ids = []
+        self.collected_data = None
+        # incremented every time the scene data is collected again after a change
+        self.scene_version = 0
+        self.check_cache = {}
+        self.watch_scene_changes()
+
+    def watch_scene_changes(self):
+        """Registers the callbacks flagging changes in the scene that can alter the collected data,
+        like nodes added, removed or renamed, reparenting, connections and new or opened scenes.
+        """
+        self.remove_callbacks()
+
+        def _flag_scene_changed(*args):
+            self.scene_changed = True
+
+        self.callback_ids.extend(
+            [
+                om.MDGMessage.addNodeAddedCallback(_flag_scene_changed, 'dependNode'),
+                om.MDGMessage.addNodeRemovedCallback(_flag_scene_changed, 'dependNode'),
+                om.MDGMessage.addConnectionCallback(_flag_scene_changed),
+                om.MDagMessage.addAllDagChangesCallback(_flag_scene_changed),
+                om.MNodeMessage.addNameChangedCallback(om.MObject(), _flag_scene_changed),
+                om.MSceneMessage.addCallback(om.MSceneMessage.kAfterOpen, _flag_scene_changed),
+                om.MSceneMessage.addCallback(om.MSceneMessage.kAfterNew, _flag_scene_changed),
+                om.MEventMessage.addEventCallback('Undo', _flag_scene_changed),
+                om.MEventMessage.addEventCallback('Redo', _flag_scene_changed),
+            ]
+        )
+
+    def watch_mesh_attributes(self, meshes):
+        """Registers the callbacks flagging changes to the mesh attributes read while collecting
+        the data, replacing the ones registered for a previous collection.
+        Args:
+            meshes (list[str]): The full path names of the mesh shapes to watch.
+        """
+        self.remove_attribute_callbacks()
+
+        def _flag_attribute_changed(message, plug, other_plug, client_data):
+            if plug.partialName(useLongNames=True) in COLLECTED_MESH_ATTRIBUTES:
+                self.scene_changed = True
+
+        for dag_path in utilities.get_dag_paths(meshes):
+            self.attribute_callback_ids.append(
+                om.MNodeMessage.addAttributeChangedCallback(dag_path.node(), _flag_attribute_changed)
+            )
+
+    def remove_attribute_callbacks(self):
+        """Removes the callbacks registered by this instance to watch the mesh attributes."""
+        if self.attribute_callback_ids:
+            om.MMessage.removeCallbacks(self.attribute_callback_ids)
+            del self.attribute_callback_ids[:]
+
+    def remove_callbacks(self):
+        """Removes the callbacks registered by this instance to watch scene changes."""
+        if self.callback_ids:
+            om.MMessage.removeCallbacks(self.callback_ids)
+            del self.callback_ids[:]
+
+        self.remove_attribute_callbacks()
+
+    def collect_data(self, mode=static.VALIDATION_NORMAL):
         """Collects data from the scene, like geo group, meshes inside group,
         root joint rigging a mesh inside geo group, blendshapes targets in the scene
         and the group holding the root joint.
+        If the scene did not change since the last collection, the previously collected
+        data is restored instead of walking the scene again.
+        Args:
+            mode (str): The mode the validation is running on. It can be either static.VALIDATION_NORMAL
+                or static.VALIDATION_USD
         """
         self.reset_variables()
+        # since metadata was reset, we need to add this value coming from the ui
+        self.metadata_json['usd'] = mode == static.VALIDATION_USD
+
+        if not self.scene_changed and self.collected_data:
+            for key, value in self.collected_data.items():
+                setattr(self, key, copy.copy(value))
+            return
+
+        self.scene_changed = False
+        self.scene_version += 1
 
         geo_grp = cmds.ls('GEO')
 
         if geo_grp:
             self.geo_group = geo_grp
-            meshes = cmds.listRelatives(self.geo_group, ad=True, type='mesh', noIntermediate=True, fullPath=True)
+            # intermediate meshes are listed too, they are watched in case they stop being intermediate
+            meshes = cmds.listRelatives(self.geo_group, ad=True, type='mesh', fullPath=True)
+            self.watch_mesh_attributes(meshes or [])
 
             if meshes:
                 self.all_meshes = []
@@ -63,11 +166,17 @@ class CollectExportData:
                 for mesh in meshes:
                     if cmds.getAttr('%s.intermediateObject' % mesh) == 0:
                         self.all_meshes.append(mesh)
+                        # the parent transform is the full path without the shape
+                        self.mesh_transforms[mesh] = mesh.rsplit('|', 1)[0]
+
+                # membership tests against the character meshes do not scan the list
+                self.all_meshes_set = frozenset(self.all_meshes)
             else:
                 self.all_meshes = None
 
         else:
             self.geo_group = None
+            self.remove_attribute_callbacks()
 
         # Find root joint
         all_shapes = cmds.listRelatives(self.geo_group, ad=True, noIntermediate=True, type='shape', fullPath=True)
@@ -101,12 +210,22 @@ class CollectExportData:
 
         if all_blendshapes is not None:
             for blendshape in all_blendshapes:
-                bs_geometries = cmds.listConnections(blendshape + '.inputTarget')
+                bs_geometries = cmds.listConnections(blendshape + '.inputTarget', source=True, destination=False)
 
                 if bs_geometries:
                     for bs_geo in bs_geometries:
                         self.blendshapes.append(bs_geo)
 
+        # List scene wide nodes needed by several checks with a single query.
+        # showType interleaves names and types: [node, type, node, type, ...]
+        self.scene_nodes = {node_type: [] for node_type in SCENE_NODE_TYPES}
+        self.xgen_loaded = any(cmds.pluginInfo(plugin, query=True, loaded=True) for plugin in XGEN_PLUGINS)
+        typed_nodes = (cmds.ls(type=SCENE_NODE_TYPES, showType=True) or []) if self.xgen_loaded else []
+
+        for node, node_type in zip(typed_nodes[::2], typed_nodes[1::2]):
+            if node_type in self.scene_nodes:
+                self.scene_nodes[node_type].append(node)
+
         # Find rig group
         if self.rig_selection:
 
@@ -118,14 +237,75 @@ class CollectExportData:
             if rig_group.endswith(suffix):
                 self.rig_group = rig_group
 
+        self.collected_data = {
+            key: copy.copy(getattr(self, key))
+            for key in [
+                'geo_group', 'all_meshes', 'all_meshes_set', 'mesh_transforms', 'rig_selection', 'rig_group',
+                'blendshapes', 'scene_nodes', 'xgen_loaded',
+            ]
+        }
+
     def reset_variables(self):
         """Resets the object's scene data properties."""
         self.geo_group = None
         self.all_meshes = None
+        self.all_meshes_set = frozenset()
+        self.mesh_transforms = {}
         self.rig_selection = None
         self.rig_group = None
         self.blendshapes = []
+        self.scene_nodes = {}
+        self.xgen_loaded = False
         self.materials = []
+        self.material_connections_messages = None
         self.file_nodes = {}
+        self.texture_file_nodes = {}
+        self.node_types = {}
+        self.descendants = {}
+        self.rig_mapping = None
         self.meshes_with_history = []
         self.metadata_json = copy.deepcopy(static.metadata_template)
+
+    def get_rig_mapping(self):
+        """Returns the joint mapping stored in the scene, reading it only once since the
+        scene data was last collected.
+        Returns:
+            dict or None: The joint mapping or None if the scene has no joint mapping.
+        Notes:
+            retargeting_check always reads the mapping again and refreshes this cache, since the
+                joint mapping window edits the mapping between validation runs.
+        """
+        if self.rig_mapping is None:
+            self.rig_mapping = utilities.read_data('rig_mapping')
+
+        return self.rig_mapping
+
+    def get_descendants(self, nodes, node_type=None):
+        """Returns all the descendants of the given nodes, listing them only once since the
+        scene data was last collected.
+        Args:
+            nodes (list[str]): The names of the nodes.
+            node_type (str): Only list descendants of this type. Optional, defaults to all types.
+        Returns:
+            list[str]: the unique path names of the descendants.
+        """
+        key = (tuple(nodes), node_type)
+
+        if key not in self.descendants:
+            kwargs = {'type': node_type} if node_type else {}
+            self.descendants[key] = cmds.listRelatives(nodes, allDescendents=True, path=True, **kwargs) or []
+
+        return self.descendants[key]
+
+    def node_type(self, node):
+        """Returns the type of a node, querying it only the first time for each node
+        since the scene data was last collected.
+        Args:
+            node (str): The name of the node.
+        Returns:
+            str: the type of the node.
+        """
+        if node not in self.node_types:
+            self.node_types[node] = cmds.nodeType(node)
+
+        return self.node_types[node]
@@ -20,6 +20,7 @@ class ScriptOutputWindow(object):
         self.width = 400
 
         self.main_gui = gui_inst
+        self.written_count = 0
 
         if cmds.window(self.window, exists=True):
             cmds.deleteUI(self.window, window=True)
@@ -59,6 +60,13 @@ class ScriptOutputWindow(object):
 
     def update_terminal(self):
         """Updates the text in the Script Output Window with all the output messages
-        stored in the main ui.
+        stored in the main ui. Only the messages added since the last update are
+        appended to the field.
         """
-        cmds.scrollField(self.scroll_list, text=self.main_gui.all_output_messages, e=True)
+        new_messages = self.main_gui.all_output_messages[self.written_count:]
+        if not new_messages:
+            return
+
+        # position 0 inserts the text at the end of the field
+        cmds.scrollField(self.scroll_list, insertText=''.join(new_messages), insertionPosition=0, e=True)
+        self.written_count += len(new_messages)
@@ -53,7 +53,7 @@ material_attributes = {
     'aiFlat': {'color': ['emission_value', 'emission_texture']},
 }
 
-accepting_textures = [
+accepting_textures = frozenset([
     'baseColor',
     'metalness',
     'specularColor',
@@ -64,7 +64,7 @@ accepting_textures = [
     'emissionColor',
     'opacity',
     'normalCamera',
-]
+])
 
 ADDON_VERSION = '1.1.2'
 METADATA_VERSION = '1.1.1'
@@ -422,7 +422,13 @@ ik_pairs = {
     }
 
 # Nodes that will fail a construction history check
-history_nodes = ['deleteComponent', 'geometryFilter', 'polyBase']
+history_nodes = frozenset(['deleteComponent', 'geometryFilter', 'polyBase'])
 
 VALIDATION_NORMAL = 'normal'
 VALIDATION_USD = 'usd'
+
+# Validator statuses that allow the character to be exported
+EXPORT_ACCEPTED_STATUSES = frozenset(['pass', 'skip', 'warning', 'warning_fix'])
+
+# Matrices this close to the identity are considered zeroed, absorbing float noise left by constraints or history
+IDENTITY_TOLERANCE = 1e-6
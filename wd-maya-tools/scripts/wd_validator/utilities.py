@@ -9,6 +9,7 @@
 
 import json
 import base64
+import concurrent.futures
 import os
 import re
 import glob
@@ -17,12 +18,17 @@ import shutil
 from wd_validator import static
 
 import maya.cmds as cmds
-import xgenm as xg
+import maya.api.OpenMaya as om
 
 
 # Code should be Python27 compatible
 # pylint: disable=consider-using-f-string
 
+_EYE_DATA_KEYS = tuple(static.eye_values.keys())
+_UDIM_REGEX = re.compile(r'(?<=[\.|_])[1][0-9]{3}(?=[\.|_])|<udim>', re.MULTILINE | re.IGNORECASE)
+# Base type of each node type, filled as types are found by get_base_node_type
+_BASE_NODE_TYPES = {}
+
 
 def write_data(key, dict_data):
     """Persists data by saving it encoded in the header section of the maya file.
@@ -32,7 +38,8 @@ def write_data(key, dict_data):
     Notes:
         valid keys are eyes_mapping, rig_mapping, rig_status and face_mesh.
     """
-    dict_string = json.dumps(dict_data)
+    # compact separators and raw unicode keep the payload small before base64 inflates it
+    dict_string = json.dumps(dict_data, separators=(',', ':'), ensure_ascii=False)
     encoded_data = base64.b64encode(dict_string.encode('utf-8'))
 
     cmds.fileInfo(key, encoded_data)
@@ -96,12 +103,14 @@ def abort_validation(scene_data):
     Args:
         scene_data (CollectExportData): the object holding the scene data.
     """
+    gui_inst = scene_data.gui_inst
+
     for key, val in scene_data.validation_data.items():
         if val is None:
-            scene_data.gui_inst.update_status(val_type=key, status='aborted')
+            gui_inst.update_status(val_type=key, status='aborted')
 
     message = ['>>> Validation ABORTED.', '  > Make sure to fix current errors before continuing with the validation.']
-    scene_data.gui_inst.update_script_output(message=message)
+    gui_inst.update_script_output(message=message)
 
 
 def remove_namespaces():
@@ -111,17 +120,18 @@ def remove_namespaces():
     """
     cmds.namespace(setNamespace=':')
 
-    default_namespaces = ['UI', 'shared']
+    default_namespaces = frozenset(['UI', 'shared'])
     all_namespaces = [
         x for x in cmds.namespaceInfo(listOnlyNamespaces=True, recurse=True) if x not in default_namespaces
     ]
 
     if all_namespaces:
+        # nested namespaces are longer, so they are merged before their parents
+        # and every namespace in the list still exists when it is reached.
         all_namespaces.sort(key=len, reverse=True)
 
         for namespace in all_namespaces:
-            if cmds.namespace(exists=namespace) is True:
-                cmds.namespace(removeNamespace=namespace, mergeNamespaceWithRoot=True)
+            cmds.namespace(removeNamespace=namespace, mergeNamespaceWithRoot=True)
 
 
 def get_texture_path(file_node):
@@ -132,7 +142,6 @@ def get_texture_path(file_node):
     Returns:
         list[str] or None: A list of all the found textures or None if none found.
     """
-    regex = r'(?<=[\.|_])[1][0-9]{3}(?=[\.|_])|<udim>'
     file_node_type = cmds.nodeType(file_node)
 
     if file_node_type == 'file':
@@ -141,11 +150,47 @@ def get_texture_path(file_node):
     else:
         texture_path = cmds.getAttr('{}.filename'.format(file_node)) or None
 
+    return expand_texture_path(texture_path)
+
+
+def get_texture_paths(file_nodes):
+    """Gets the list of paths on disk for textures of several file nodes at once, reading
+    the texture attribute plugs through OpenMaya instead of querying each node.
+    UDIM textures will be expanded to existing files matching the UDIM description.
+    Args:
+        file_nodes (list[str]): The names of the "file" or "aiImage" nodes to inspect.
+    Returns:
+        dict: the list of found textures, or None if none found, by file node name.
+    """
+    selection = om.MSelectionList()
+
+    for file_node in file_nodes:
+        selection.add(file_node)
+
+    texture_paths = {}
+
+    for file_node, index in zip(file_nodes, range(selection.length())):
+        node_fn = om.MFnDependencyNode(selection.getDependNode(index))
+        attribute = 'fileTextureName' if node_fn.typeName == 'file' else 'filename'
+        texture_path = node_fn.findPlug(attribute, False).asString() or None
+        texture_paths[file_node] = expand_texture_path(texture_path)
+
+    return texture_paths
+
+
+def expand_texture_path(texture_path):
+    """Expands a texture path to the list of paths on disk it refers to.
+    UDIM textures will be expanded to existing files matching the UDIM description.
+    Args:
+        texture_path (str or None): The texture path as set in the file node.
+    Returns:
+        list[str] or None: A list of all the found textures or None if there is no path.
+    """
     if texture_path:
-        udim_check = re.search(regex, texture_path, re.MULTILINE | re.IGNORECASE)
+        udim_check = _UDIM_REGEX.search(texture_path)
 
         if udim_check:
-            check_path = re.sub(regex, '*', texture_path, flags=re.MULTILINE | re.IGNORECASE)
+            check_path = _UDIM_REGEX.sub('*', texture_path)
             all_textures = glob.glob(check_path)
 
             return all_textures
@@ -171,7 +216,7 @@ def get_attribute_value(material, attribute):
             tuple(float, str or None): the attribute value, the path to the texture or None if it was not set.
     """
     # bump_data = {}
-    connection = cmds.listConnections(material + '.' + attribute) or None
+    connection = cmds.listConnections(material + '.' + attribute, source=True, destination=False) or None
 
     if connection is not None and attribute in static.accepting_textures:
         connection_type = cmds.nodeType(connection[0])
@@ -193,7 +238,10 @@ def get_attribute_value(material, attribute):
         else:
             # Input is a bump node
             bump_input_attr = static.supported_bump_nodes[connection_type]['input_attr']
-            bump_file_node = cmds.listConnections('{c}.{b}'.format(c=connection[0], b=bump_input_attr)) or None
+            bump_file_node = (
+                cmds.listConnections('{c}.{b}'.format(c=connection[0], b=bump_input_attr), source=True, destination=False)
+                or None
+            )
 
             bump_flip = False
 
@@ -265,16 +313,16 @@ def get_material_meshes(material, short_name=True):
 
     """
     all_meshes = []
-    shading_groups = cmds.listConnections(material + '.outColor', type='shadingEngine')
+    shading_groups = cmds.listConnections(material + '.outColor', type='shadingEngine', source=False, destination=True)
     for shading_group in shading_groups:
-        sg_meshes = cmds.listConnections(shading_group + '.dagSetMembers', type='mesh')
+        sg_meshes = cmds.listConnections(shading_group + '.dagSetMembers', type='mesh', source=True, destination=False)
         if sg_meshes:
-            for mesh in sg_meshes:
-                if cmds.ls(mesh, long=True)[0].split('|')[1] == 'GEO': # To exclude blendshape geometries from metadata
-                    all_meshes.append(mesh)
+            # To exclude blendshape geometries from metadata
+            all_meshes.extend(mesh for mesh in cmds.ls(sg_meshes, long=True) if mesh.split('|')[1] == 'GEO')
 
+    # leaf names, ls shortNames would return a longer unique path for non unique names
     if short_name:
-        all_meshes = [mesh.split('|')[-1] for mesh in all_meshes]
+        all_meshes = [mesh.rpartition('|')[2] for mesh in all_meshes]
 
     return all_meshes
 
@@ -291,24 +339,103 @@ def make_extension_lowercase(file):
     return file[0] + file[1].lower()
 
 
+def _copy_texture(paths):
+    """Copies a single texture.
+    Args:
+        paths (tuple(str, str)): the source path and the destination path.
+    """
+    source, destination = paths
+    shutil.copyfile(source, destination)
+
+
 def copy_textures(source_path, target_dir):
-    """Copies a texture to a different path.
+    """Copies a texture to a different path. When more than one file is given (UDIMs)
+    the copies are run in parallel since each of them is independent and IO bound.
     Args:
         source_path (str): full path to source texture.
         target_dir (str): full path to destination folder.
     Raises:
-        FileNotFoundError: if the destination folder does not exists or user does not have
-            write access in destination folder.
+        PermissionError: if user does not have write access in destination folder.
         FileNotFoundError: if the source file does not exists or user has no read access.
+    Notes:
+        The destination folder is created if it does not exist. Textures that already are
+            the destination file are skipped.
     """
-    if source_path:
-        for path in source_path:
-            texture_name = make_extension_lowercase(os.path.split(path)[-1])
-            destination_path = os.path.join(target_dir, texture_name).replace('\\', '/')
-            try:
-                shutil.copy(path, destination_path)
-            except shutil.SameFileError as e:
-                print(e)
+    if not source_path:
+        return
+
+    os.makedirs(target_dir, exist_ok=True)
+
+    copy_pairs = []
+    for path in source_path:
+        texture_name = make_extension_lowercase(os.path.split(path)[-1])
+        destination_path = os.path.join(target_dir, texture_name).replace('\\', '/')
+
+        if os.path.exists(destination_path) and os.path.samefile(path, destination_path):
+            print('Skipping copy, {} is already in the destination folder.'.format(path))
+            continue
+
+        copy_pairs.append((path, destination_path))
+
+    if not copy_pairs:
+        return
+
+    if len(copy_pairs) == 1:
+        _copy_texture(copy_pairs[0])
+        return
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=min(8, len(copy_pairs))) as executor:
+        # consuming the results so any copy error is raised here
+        list(executor.map(_copy_texture, copy_pairs))
+
+
+def _list_folder(folder):
+    """Lists the entries of a single folder.
+    Args:
+        folder (str): the path of the folder.
+    Returns:
+        set[str]: the normcased names of the entries, empty if the folder can not be read.
+    """
+    try:
+        return {os.path.normcase(entry.name) for entry in os.scandir(folder)}
+    except OSError:
+        # missing folder or no read access, none of its files can be accessed
+        return set()
+
+
+def get_existing_files(paths):
+    """Returns which of the given paths exist on disk. Paths are grouped by folder and each
+    folder is listed once, instead of checking every path on its own, so textures sharing a
+    folder (like UDIMs) cost a single listing. When there are several folders they are listed
+    in parallel, since on network storage each listing is bound by its latency.
+    Args:
+        paths (iterable[str]): the paths to check.
+    Returns:
+        set[str]: the given paths that exist on disk.
+    Notes:
+        Names are compared with os.path.normcase, which only folds the case on Windows. Paths
+            not found in their folder listing are checked with os.path.exists, so case insensitive
+            file systems elsewhere (like the macOS default) still find them.
+    """
+    folder_paths = {}
+    for path in paths:
+        folder, name = os.path.split(path)
+        folder_paths.setdefault(folder or os.curdir, []).append((os.path.normcase(name), path))
+
+    folders = list(folder_paths.keys())
+    if len(folders) < 8:
+        folder_entries = [_list_folder(folder) for folder in folders]
+    else:
+        with concurrent.futures.ThreadPoolExecutor(max_workers=min(16, len(folders))) as executor:
+            folder_entries = list(executor.map(_list_folder, folders))
+
+    existing_files = set()
+    for folder, entries in zip(folders, folder_entries):
+        for name, path in folder_paths[folder]:
+            if name in entries or os.path.exists(path):
+                existing_files.add(path)
+
+    return existing_files
 
 
 def get_eyes_data():
@@ -323,34 +450,32 @@ def get_eyes_data():
     if check_data(key='eyes_mapping'):
         eye_mapping = read_data(key='eyes_mapping')
 
+        # Checking all bones existence with a single query. Stored names can be short or
+        # partial paths, so they are matched against the end of the existing long paths.
+        bones = [eye['bone_field_value'] for eye in eye_mapping.values() if eye['bone_field_value']]
+        existing_bones = cmds.ls(bones, long=True) if bones else []
+
+        def _bone_exists(bone):
+            path = bone if bone.startswith('|') else '|' + bone
+            return any(existing.endswith(path) for existing in existing_bones)
+
         for eye in eye_mapping.values():
-            skip = False
-
-            if eye['bone_field_value']:
-                if cmds.objExists(eye['bone_field_value']):
-                    for value in static.eye_values.keys():
-                        # Check if all fields are set
-                        if eye[value] is None:
-                            skip = True
-                            break
-                else:
-                    skip = True
-            else:
-                skip = True
+            # Skip eyes with a missing bone or with any field not set
+            if not eye['bone_field_value'] or not _bone_exists(eye['bone_field_value']):
+                continue
 
-            if skip:
+            if any(eye[value] is None for value in _EYE_DATA_KEYS):
                 continue
 
-            else:
-                eye_data = {
-                    'bone_name': eye['bone_field_value'].split('|')[-1],
-                    'horizontal_rotation_axis': eye['horizontal_axis_menu_value'],
-                    'vertical_rotation_axis': eye['vertical_axis_menu_value'],
-                    'horizontal_min_max_value': [eye['horizontal_min_field_value'], eye['horizontal_max_field_value']],
-                    'vertical_min_max_value': [eye['vertical_min_field_value'], eye['vertical_max_field_value']],
-                }
+            eye_data = {
+                'bone_name': eye['bone_field_value'].split('|')[-1],
+                'horizontal_rotation_axis': eye['horizontal_axis_menu_value'],
+                'vertical_rotation_axis': eye['vertical_axis_menu_value'],
+                'horizontal_min_max_value': [eye['horizontal_min_field_value'], eye['horizontal_max_field_value']],
+                'vertical_min_max_value': [eye['vertical_min_field_value'], eye['vertical_max_field_value']],
+            }
 
-                all_data.append(eye_data)
+            all_data.append(eye_data)
 
     if all_data:
         return all_data
@@ -373,26 +498,208 @@ def camel_case_split(text):
     return split_text
 
 
-def get_pre_skin_history(mesh):
+def get_pre_skin_history(mesh, show_type=False):
     """ List all non deforming history of a mesh
     Args:
         mesh (str): Mesh that needs checking
+        show_type (bool): Whether or not to return the type of each node along with its name.
+            Optional, defaults to False.
     Returns:
-        list: List of all nodes that belong to non-deforming history
+        list: List of all nodes that belong to non-deforming history, or (node, type) tuples
+            if show_type is True.
     """
-    history_before_skin = []
-    history = cmds.ls(cmds.listHistory(mesh), l=True)
+    # showType interleaves names and types: [node, type, node, type, ...]
+    history = cmds.ls(cmds.listHistory(mesh), l=True, showType=True)
 
     if not history:
-        return history_before_skin
+        return []
+
+    nodes = history[2::2] # first history is the shape itself
+    node_types = history[3::2]
+
+    if 'skinCluster' in node_types:
+        skin_index = node_types.index('skinCluster')
+        nodes = nodes[:skin_index]
+        node_types = node_types[:skin_index]
+
+    if show_type:
+        return list(zip(nodes, node_types))
+
+    return nodes
+
+
+def get_base_node_type(node_type):
+    """Returns the first type a node type inherits from, e.g. polyBase for polySplit.
+    Each type is only queried the first time, node type hierarchies do not change.
+    Args:
+        node_type (str): the name of the node type.
+    Returns:
+        str: the name of the base type.
+    """
+    if node_type not in _BASE_NODE_TYPES:
+        _BASE_NODE_TYPES[node_type] = cmds.nodeType(node_type, isTypeName=True, inherited=True)[0]
+
+    return _BASE_NODE_TYPES[node_type]
+
+def get_dag_paths(nodes):
+    """Resolves DAG nodes to OpenMaya dag paths, using a single selection list for all of them.
+    Args:
+        nodes (list[str]): The names of the DAG nodes to resolve.
+    Returns:
+        list[om.MDagPath]: the dag paths of the nodes, in the same order.
+    """
+    selection = om.MSelectionList()
+
+    for node in nodes:
+        selection.add(node)
+
+    return [selection.getDagPath(index) for index in range(selection.length())]
+
 
-    for node in history[1:]: # first history is the shape itself
-        if cmds.nodeType(node) == 'skinCluster':
-            break
+def get_existing_nodes(nodes):
+    """Returns which of the given nodes exist in the scene. Each name is looked up only once,
+    through a selection list instead of a cmds.objExists call per node.
+    Args:
+        nodes (list[str]): The names of the nodes to look up.
+    Returns:
+        set[str]: the names, as given, of the nodes that exist.
+    """
+    existing_nodes = set()
+
+    for node in set(nodes):
+        try:
+            om.MSelectionList().add(node)
+
+        except RuntimeError:
+            continue
+
+        existing_nodes.add(node)
+
+    return existing_nodes
+
+
+def get_mesh_transforms(root):
+    """Returns the transforms of all the meshes under a DAG node, walking its hierarchy once.
+    Args:
+        root (str): The name of the DAG node to start from.
+    Returns:
+        list[om.MDagPath]: the dag paths of the unique mesh transforms.
+    """
+    iterator = om.MItDag()
+    iterator.reset(om.MSelectionList().add(root).getDagPath(0), om.MItDag.kDepthFirst, om.MFn.kMesh)
+    mesh_transforms = {}
+
+    while not iterator.isDone():
+        transform_path = iterator.getPath().pop()
+        mesh_transforms.setdefault(transform_path.fullPathName(), transform_path)
+        iterator.next()
+
+    return list(mesh_transforms.values())
+
+
+def get_identity_transform_status(node):
+    """Returns whether or not the local and world matrices of a transform are the identity,
+    reading both from a single dag path instead of two xform queries.
+    Args:
+        node (str): The name of the transform.
+    Returns:
+        tuple(bool, bool): whether or not the local matrix, and the world matrix, are the identity.
+    Notes:
+        Matrices are compared within static.IDENTITY_TOLERANCE, so near identity values still pass.
+    """
+    dag_path = om.MSelectionList().add(node).getDagPath(0)
+    local_matrix = om.MFnTransform(dag_path).transformation().asMatrix()
+
+    return (
+        local_matrix.isEquivalent(om.MMatrix.kIdentity, static.IDENTITY_TOLERANCE),
+        dag_path.inclusiveMatrix().isEquivalent(om.MMatrix.kIdentity, static.IDENTITY_TOLERANCE),
+    )
+
+
+def get_shading_groups(meshes):
+    """Returns the shading groups assigned to each mesh, including per face assignments,
+    asking the mesh function set for its render sets instead of listing the connections
+    of every mesh.
+    Args:
+        meshes (list[str]): The full path names of the mesh shapes.
+    Returns:
+        dict: the list of shading group names assigned to each mesh, by mesh name.
+    """
+    shading_groups = {}
+
+    for mesh, dag_path in zip(meshes, get_dag_paths(meshes)):
+        sets, _ = om.MFnMesh(dag_path).getConnectedSetsAndMembers(dag_path.instanceNumber(), True)
+        shading_groups[mesh] = [om.MFnDependencyNode(set_node).name() for set_node in sets]
+
+    return shading_groups
+
+
+def get_source_nodes(node, attributes):
+    """Returns the nodes connected as source to some attributes of a node. The node is
+    resolved once and its plugs are read directly, instead of listing the connections of
+    each attribute by name.
+    Args:
+        node (str): The name of the node.
+        attributes (list[str]): The names of the destination attributes.
+    Returns:
+        dict: the name of the source node, or None if not connected, by attribute name.
+    Notes:
+        For compound attributes (like baseColor) the children are checked too when the parent
+            itself is not connected, as listConnections does, so a texture connected to a
+            single channel (like baseColorR) is still found.
+    """
+    node_fn = om.MFnDependencyNode(om.MSelectionList().add(node).getDependNode(0))
+    source_nodes = {}
+
+    for attribute in attributes:
+        plug = node_fn.findPlug(attribute, False)
+        source_plug = plug.source()
+
+        if source_plug.isNull and plug.isCompound:
+            for index in range(plug.numChildren()):
+                source_plug = plug.child(index).source()
+                if not source_plug.isNull:
+                    break
+
+        source_nodes[attribute] = None if source_plug.isNull else om.MFnDependencyNode(source_plug.node()).name()
+
+    return source_nodes
+
+
+def has_upstream_node(node, node_filter):
+    """Returns whether or not the node has a node of the given type in its history. The
+    graph is walked upstream only until the first node of that type is found.
+    Args:
+        node (str): Name of the node to start from.
+        node_filter (int): The OpenMaya function set type to look for, e.g. om.MFn.kSkinClusterFilter.
+    Returns:
+        bool: whether or not a node of the given type was found.
+    """
+    start_node = om.MSelectionList().add(node).getDependNode(0)
+    iterator = om.MItDependencyGraph(start_node, node_filter, om.MItDependencyGraph.kUpstream)
+
+    return not iterator.isDone()
+
+
+def get_upstream_nodes(node, node_filter):
+    """Returns the nodes of the given type in the history of a node, walking the graph
+    upstream instead of listing the whole history and filtering it.
+    Args:
+        node (str): Name of the node to start from.
+        node_filter (int): The OpenMaya function set type to look for, e.g. om.MFn.kBlendShape.
+    Returns:
+        list[str]: The names of the nodes found, closest to the starting node first.
+    """
+    start_node = om.MSelectionList().add(node).getDependNode(0)
+    iterator = om.MItDependencyGraph(start_node, node_filter, om.MItDependencyGraph.kUpstream)
+    found_nodes = []
 
-        history_before_skin.append(node)
+    while not iterator.isDone():
+        found_nodes.append(om.MFnDependencyNode(iterator.currentNode()).name())
+        iterator.next()
+
+    return found_nodes
 
-    return history_before_skin
 
 def get_spline_description(spline_base):
     """ Goes trough the network of nodes until it finds the xgmSplineDescription node in the graph.
@@ -402,7 +709,7 @@ def get_spline_description(spline_base):
     Returns:
         str or None: Name of the spline description if found or None.
     """
-    node = cmds.listConnections('{}.outSplineData'.format(spline_base), shapes=True)
+    node = cmds.listConnections('{}.outSplineData'.format(spline_base), shapes=True, source=False, destination=True)
 
     while True:
         if not node:
@@ -411,7 +718,7 @@ def get_spline_description(spline_base):
         if cmds.nodeType(node[0]) == 'xgmSplineDescription':
             return node[0]
 
-        node = cmds.listConnections('{}.outSplineData'.format(node[0]), shapes=True)
+        node = cmds.listConnections('{}.outSplineData'.format(node[0]), shapes=True, source=False, destination=True)
 
 
 def is_valid_usd_name(name):
@@ -451,12 +758,87 @@ def get_animation_curves_connected_to_group(*groups):
     Returns:
         list[str]: The list of animation curves found.
     """
-    group_nodes = list(groups) + cmds.listRelatives(groups, allDescendents=True, path=True) or []
-    animation_curves_found = cmds.ls(cmds.listConnections(group_nodes), type='animCurve')
-    animation_curves_found += cmds.ls(cmds.listHistory(group_nodes), type='animCurve')
+    group_nodes = list(groups) + (cmds.listRelatives(groups, allDescendents=True, path=True) or [])
+    return get_animation_curves_connected_to_nodes(group_nodes)
+
+
+def get_animation_curves_connected_to_nodes(nodes):
+    """Returns any animation curve connected to the nodes and their history.
+
+    Args:
+        nodes (list[str]): The nodes to inspect, e.g. a group and all its descendants.
+
+    Returns:
+        list[str]: The list of animation curves found.
+    """
+    connected_nodes = (cmds.listConnections(nodes) or []) + (cmds.listHistory(nodes) or [])
+
+    # cmds.ls with nothing to filter would list every animation curve in the scene
+    if not connected_nodes:
+        return []
+
+    animation_curves_found = cmds.ls(connected_nodes, type='animCurve')
     return sorted(list(set(animation_curves_found)))
 
 
+class FastMayaContext(object):
+    """Context that groups the scene editing commands run inside it in a single undo chunk
+    and turns the evaluation manager off meanwhile, restoring its previous mode afterwards.
+    It can also suspend the viewport refresh, in which case only the outermost context will
+    resume it.
+    Notes:
+        The undo queue is kept enabled on purpose: editing the scene with undo disabled leaves
+            the queue out of sync with the scene, and undoing past the edits can corrupt it.
+    """
+
+    # number of nested contexts currently suspending the refresh
+    refresh_suspensions = 0
+
+    def __init__(self, undo_chunk=True, pause_evaluation=True, suspend_refresh=False):
+        """
+        Args:
+            undo_chunk (bool, optional): whether or not to group the commands in a single undo chunk,
+                so the whole edit is undone at once. Defaults to True.
+            pause_evaluation (bool, optional): whether or not to turn the evaluation manager off.
+                Defaults to True.
+            suspend_refresh (bool, optional): whether or not to suspend the viewport refresh.
+                Defaults to False.
+        """
+        self.undo_chunk = undo_chunk
+        self.pause_evaluation = pause_evaluation
+        self.suspend_refresh = suspend_refresh
+
+        self.evaluation_mode = None
+
+    def __enter__(self):
+        if self.undo_chunk:
+            cmds.undoInfo(openChunk=True)
+
+        if self.pause_evaluation:
+            self.evaluation_mode = cmds.evaluationManager(query=True, mode=True)[0]
+            if self.evaluation_mode != 'off':
+                cmds.evaluationManager(mode='off')
+
+        if self.suspend_refresh:
+            if not FastMayaContext.refresh_suspensions:
+                cmds.refresh(suspend=True)
+            FastMayaContext.refresh_suspensions += 1
+
+        return self
+
+    def __exit__(self, exc_type, exc_value, exc_tb):
+        if self.suspend_refresh:
+            FastMayaContext.refresh_suspensions -= 1
+            if not FastMayaContext.refresh_suspensions:
+                cmds.refresh(suspend=False)
+
+        if self.pause_evaluation and self.evaluation_mode != 'off':
+            cmds.evaluationManager(mode=self.evaluation_mode)
+
+        if self.undo_chunk:
+            cmds.undoInfo(closeChunk=True)
+
+
 def disconnect_curves(animation_curves):
     """Disconnect the curves from it's source connection.
 
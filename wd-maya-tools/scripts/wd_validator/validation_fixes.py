@@ -9,11 +9,14 @@ import datetime
 import os
 import importlib
 
-from maya import cmds, mel
+from maya import cmds
+import maya.api.OpenMaya as om
 
 from wd_validator import utilities
 
-importlib.reload(utilities)
+# Reloading is only needed while developing the add-on
+if os.environ.get('WD_VALIDATOR_DEV'):
+    importlib.reload(utilities)
 
 # code needs to run in python 2.7
 # pylint: disable=consider-using-f-string
@@ -27,22 +30,23 @@ def all_group_fix(scene_data):
     """
 
     print('This should fix the group missing or misnamed mismatching or transformed')
-    # create empty group
-    group = cmds.group(em=True)
+    with utilities.FastMayaContext():
+        # create empty group
+        group = cmds.group(em=True)
 
-    # parent body and geo
-    cmds.parent(scene_data.geo_group, group)
-    cmds.parent(scene_data.rig_group, group)
+        # parent body and geo
+        cmds.parent(scene_data.geo_group, group)
+        cmds.parent(scene_data.rig_group, group)
 
-    # make sure there is not other all in the root
-    name = 'all'
-    target = '|{}'.format(name)
-    if cmds.objExists(target):
-        new_name = name + datetime.datetime.now().strftime('%y%m%d%H%M%S%f')
-        cmds.rename(target, new_name)
+        # make sure there is not other all in the root
+        name = 'all'
+        target = '|{}'.format(name)
+        if cmds.objExists(target):
+            new_name = name + datetime.datetime.now().strftime('%y%m%d%H%M%S%f')
+            cmds.rename(target, new_name)
 
-    # rename as all
-    cmds.rename(group, target)
+        # rename as all
+        cmds.rename(group, target)
 
 
 def joint_name_fix(scene_data):
@@ -54,17 +58,26 @@ def joint_name_fix(scene_data):
     if scene_data.validation_data.get('rig_check') != 'fix':
         return
 
-    def _fix_joint_name(joint):
+    def _fixed_joint_name(joint):
         # fix by removing all namespaces. In this way, the bone auto assign can still work.
-        new_name = joint.rsplit(':', 1)[-1]
+        new_name = joint.rsplit('|', 1)[-1].rsplit(':', 1)[-1]
         # we still need to check for weird characters
-        new_name = utilities.to_valid_usd_name(new_name)
-        cmds.rename(joint, new_name)
+        return utilities.to_valid_usd_name(new_name)
 
     joints = cmds.listRelatives(scene_data.rig_selection, ad=1, pa=1, type='joint') or []
     joints += [scene_data.rig_selection]
+
+    # MObjects stay valid while parents are renamed, so the current path of each joint is read
+    # from them. The renames go through cmds.rename so they are recorded in the undo queue.
+    selection = om.MSelectionList()
     for joint in joints:
-        _fix_joint_name(joint)
+        selection.add(joint)
+
+    new_names = [_fixed_joint_name(joint) for joint in joints]
+
+    with utilities.FastMayaContext():
+        for i, new_name in enumerate(new_names):
+            cmds.rename(om.MFnDagNode(selection.getDependNode(i)).partialPathName(), new_name)
 
 
 def remove_animation_on_rig_fix(scene_data):
@@ -94,7 +107,8 @@ def remove_animation_on_geo_fix(scene_data):
     geo_group = scene_data.geo_group or []
 
     # keeping existing group
-    valid_geo_groups = [grp for grp in geo_group if grp and cmds.objExists(grp)]
+    existing_groups = utilities.get_existing_nodes([grp for grp in geo_group if grp])
+    valid_geo_groups = [grp for grp in geo_group if grp in existing_groups]
 
     if not valid_geo_groups:
         print('>>> WARNING! Could not find the GEO group!')
@@ -105,14 +119,18 @@ def remove_animation_on_geo_fix(scene_data):
 
 
 def reference_data_fix():
-    """Imports all reference content in this maya scene."""
-    all_references = cmds.file(query=True, reference=True)
+    """Imports all reference content in this maya scene. Nested references become top level
+    references once their parent is imported, so the scene is queried again until none are left.
+    """
+    with utilities.FastMayaContext():
+        while True:
+            all_references = cmds.file(query=True, reference=True) or []
 
-    if all_references:
-        for ref in all_references:
-            cmds.file(ref, importReference=True)
+            if not all_references:
+                break
 
-        reference_data_fix()
+            for ref in all_references:
+                cmds.file(ref, importReference=True)
 
     # utilities.remove_namespaces()
 
@@ -123,9 +141,10 @@ def fix_empty_file_nodes(scene_data):
     Args:
         scene_data (CollectExportData): the object with the scene data alreadu initialized.
     """
-    for file_node, texture_path in scene_data.file_nodes.items():
-        if not texture_path:
-            cmds.delete(file_node)
+    with utilities.FastMayaContext():
+        for file_node, texture_path in scene_data.file_nodes.items():
+            if not texture_path:
+                cmds.delete(file_node)
 
 
 def save_scene(overwrite=True):
@@ -165,21 +184,22 @@ def remove_pre_skin_history(scene_data):
     answer = cmds.confirmDialog(title='Warning', message=message, button=['Apply Bypass Fix','Abort'], defaultButton='Apply Bypass Fix', cancelButton='Abort', dismissString='Abort')
 
     if answer == 'Apply Bypass Fix':
-        for mesh in scene_data.meshes_with_history:
-            print('Bypassing history nodes on mesh \"{}\"'.format(mesh.split('|')[-1]))
-            history = cmds.listHistory(mesh)
-
-            # Find the skin cluster node
-            for node in history:
-                if cmds.nodeType(node) == 'skinCluster':
-                    skin_cluster = node
-                    break
-            else:
-                skin_cluster = None
-
-            # Connect the skin cluster node to the shape
-            if skin_cluster:
-                cmds.connectAttr(skin_cluster + '.outputGeometry[0]', mesh + '.inMesh', force=True)
+        with utilities.FastMayaContext():
+            for mesh in scene_data.meshes_with_history:
+                print('Bypassing history nodes on mesh \"{}\"'.format(mesh.split('|')[-1]))
+                history = cmds.listHistory(mesh)
+
+                # Find the skin cluster node
+                for node in history:
+                    if cmds.nodeType(node) == 'skinCluster':
+                        skin_cluster = node
+                        break
+                else:
+                    skin_cluster = None
+
+                # Connect the skin cluster node to the shape
+                if skin_cluster:
+                    cmds.connectAttr(skin_cluster + '.outputGeometry[0]', mesh + '.inMesh', force=True)
 
     else:
         print('Aborting mesh history fix.')
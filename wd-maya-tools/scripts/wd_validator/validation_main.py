@@ -10,7 +10,7 @@ To add a validation:
     be the identifier all through the process
  - Define a check in validation tools module
     See examples there
- - add the check in the flow of character_validation function
+ - add the check to CHARACTER_CHECKS, listing the checks it requires
  - if fixes needed:
     - remember to flag it in the check with 'fix' or 'warning_fix'
     - define fix function in validation_fixes module
@@ -18,13 +18,209 @@ To add a validation:
 
 """
 
+import concurrent.futures
+import heapq
 import importlib
+import os
 
 from wd_validator import validation_tools as validate, utilities, static
 
-importlib.reload(validate)
-importlib.reload(utilities)
-importlib.reload(static)
+# Reloading is only needed while developing the add-on
+if os.environ.get('WD_VALIDATOR_DEV'):
+    importlib.reload(validate)
+    importlib.reload(utilities)
+    importlib.reload(static)
+
+
+class ValidationAborted(Exception):
+    """Raised when a check can not run because the checks it requires did not succeed."""
+
+
+# Accepted statuses for the checks requirements
+PASSED = frozenset(['pass'])
+PASSED_OR_FIX = frozenset(['pass', 'fix'])
+PASSED_OR_WARNING_FIX = frozenset(['pass', 'warning_fix'])
+
+# Checks and the checks they depend on. They are run in dependency order (see sort_checks),
+# keeping the order of the table among checks that do not depend on each other. Each check
+# runs only when the checks it requires already ran with one of the listed statuses, otherwise
+# the validation is aborted. Checks are listed so that once a check can not run none of the
+# following ones could either.
+#   key: the validator identifier (as in static.validation_windows_data)
+#   check: the function in validation_tools running the check
+#   requires: mapping of validator identifier to the set of its accepted statuses
+#   uses_mode: whether or not the check receives the validation mode
+#   io_only: whether or not the check only reads scene_data and the disk. maya.cmds is not
+#       thread safe, so only these checks can be run in a worker thread.
+#   cacheable: whether or not the check result only depends on the scene nodes, their names,
+#       hierarchy and connections. These results are reused while the scene is unchanged.
+# Both scene checks query maya.cmds, so they run inline like any non io_only check.
+SCENE_CHECKS = [
+    {'key': 'scene_saved', 'check': validate.scene_saved_check},
+    {'key': 'referenced_data', 'check': validate.referenced_data_check},
+]
+
+CHARACTER_CHECKS = [
+    {'key': 'geo_check', 'check': validate.geo_group_check},
+    {'key': 'rig_check', 'check': validate.rig_check, 'requires': {'geo_check': PASSED}, 'uses_mode': True},
+    {'key': 'rig_group_check', 'check': validate.rig_group_check, 'requires': {'rig_check': PASSED_OR_WARNING_FIX}},
+    {'key': 'history_check', 'check': validate.history_check, 'requires': {'rig_check': PASSED_OR_WARNING_FIX}},
+    {
+        'key': 'all_group_check',
+        'check': validate.all_group_check,
+        'requires': {'rig_check': PASSED_OR_WARNING_FIX},
+        'uses_mode': True,
+    },
+    {'key': 'poly_count_check', 'check': validate.poly_count_check, 'requires': {'rig_group_check': PASSED}},
+    {'key': 'retargeting_check', 'check': validate.retargeting_check, 'requires': {'rig_group_check': PASSED}},
+    {'key': 'ik_check', 'check': validate.rig_ik_check, 'requires': {'rig_group_check': PASSED}},
+    {'key': 'face_check', 'check': validate.face_check, 'requires': {'rig_group_check': PASSED}},
+    {'key': 'material_type_check', 'check': validate.materials_check, 'requires': {'rig_group_check': PASSED}},
+    {
+        'key': 'naming_check',
+        'check': validate.naming_check,
+        'requires': {'material_type_check': PASSED},
+        'cacheable': True,
+    },
+    {
+        'key': 'material_connections_check',
+        'check': validate.material_connections_check,
+        'requires': {'material_type_check': PASSED},
+    },
+    {'key': 'file_nodes_check', 'check': validate.empty_file_nodes_check, 'requires': {'material_type_check': PASSED}},
+    {
+        'key': 'textures_check',
+        'check': validate.textures_check,
+        # reads the textures resolved by file_nodes_check, whatever its result
+        'requires': {'material_type_check': PASSED, 'file_nodes_check': PASSED_OR_FIX},
+        'io_only': True,
+    },
+    {'key': 'xGen_check', 'check': validate.groom_materials_check, 'requires': {'material_type_check': PASSED}},
+]
+
+
+def sort_checks(checks):
+    """Sorts the checks so that every check comes after the checks it requires. Among the
+    checks whose requirements are already placed, the one listed first in the given list is
+    placed first, so a list already in dependency order is left untouched.
+    Args:
+        checks (list[dict]): the checks to sort, described as in SCENE_CHECKS or CHARACTER_CHECKS.
+    Returns:
+        list[dict]: the sorted checks.
+    Raises:
+        ValueError: if a check requires an unknown check or the requirements are circular.
+    """
+    index_by_key = {check_data['key']: index for index, check_data in enumerate(checks)}
+    dependents = {key: [] for key in index_by_key}
+    missing_requirements = {}
+
+    for check_data in checks:
+        requirements = check_data.get('requires', {})
+
+        for key in requirements:
+            if key not in index_by_key:
+                raise ValueError('Check "{}" requires unknown check "{}"'.format(check_data['key'], key))
+
+            dependents[key].append(check_data['key'])
+
+        missing_requirements[check_data['key']] = len(requirements)
+
+    ready = [index for key, index in index_by_key.items() if not missing_requirements[key]]
+    heapq.heapify(ready)
+    sorted_checks = []
+
+    while ready:
+        check_data = checks[heapq.heappop(ready)]
+        sorted_checks.append(check_data)
+
+        for key in dependents[check_data['key']]:
+            missing_requirements[key] -= 1
+
+            if not missing_requirements[key]:
+                heapq.heappush(ready, index_by_key[key])
+
+    if len(sorted_checks) != len(checks):
+        raise ValueError('Circular requirements between checks')
+
+    return sorted_checks
+
+
+def run_checks(scene_data, checks, mode=static.VALIDATION_NORMAL):
+    """Runs the given checks in dependency order, updating the main UI with each result. The run stops
+    at the first check whose requirements are not met. Checks flagged as io_only are run in a worker
+    thread, overlapping with the following checks, and are collected before any check
+    requiring them runs. Checks flagged as cacheable reuse their last result if the scene data
+    was not collected again since then.
+    Args:
+        scene_data (CollectExportData): the object with the scene data already initialized.
+        checks (list[dict]): the checks to run, described as in SCENE_CHECKS or CHARACTER_CHECKS.
+        mode (str): The mode the validation is running on. It can be either static.VALIDATION_NORMAL
+            or static.VALIDATION_USD
+    Returns:
+        dict: the status of each executed check by its validator identifier.
+    Raises:
+        ValidationAborted: if a check requirements are not met.
+    """
+    statuses = {}
+    results = {}
+    pending = {}
+    executor = None
+
+    def _collect(key):
+        status, message = pending.pop(key).result()
+        statuses[key] = status
+        results[key] = (key, status, message)
+
+    # The UI is updated once with all the results, even if a check raises an error
+    try:
+        for check_data in sort_checks(checks):
+            requirements = check_data.get('requires', {})
+
+            for key in requirements:
+                if key in pending:
+                    _collect(key)
+
+            if any(statuses.get(key) not in accepted for key, accepted in requirements.items()):
+                for pending_key in list(pending):
+                    _collect(pending_key)
+
+                raise ValidationAborted(check_data['key'])
+
+            key = check_data['key']
+            kwargs = {'mode': mode} if check_data.get('uses_mode') else {}
+
+            cache_key = (scene_data.scene_version, mode)
+            cached = scene_data.check_cache.get(key) if check_data.get('cacheable') else None
+
+            if cached and cached[0] == cache_key:
+                status, message = cached[1]
+                scene_data.validation_data[key] = status
+                statuses[key] = status
+                results[key] = (key, status, message)
+                continue
+
+            if check_data.get('io_only'):
+                executor = executor or concurrent.futures.ThreadPoolExecutor(max_workers=4)
+                pending[key] = executor.submit(check_data['check'], scene_data, **kwargs)
+                continue
+
+            status, message = check_data['check'](scene_data, **kwargs)
+            statuses[key] = status
+            results[key] = (key, status, message)
+
+            if check_data.get('cacheable'):
+                scene_data.check_cache[key] = (cache_key, (status, message))
+
+        for key in list(pending):
+            _collect(key)
+
+    finally:
+        if executor:
+            executor.shutdown(wait=True)
+
+        scene_data.gui_inst.bulk_update([results[c['key']] for c in checks if c['key'] in results])
+
+    return statuses
 
 
 def scene_validation(scene_data):
@@ -35,20 +231,9 @@ def scene_validation(scene_data):
     Returns:
         bool: whether or not the 'scene' validation passed.
     """
-    # Checking if scene is saved
-    scene_status, message = validate.scene_saved_check(scene_data)
-    scene_data.gui_inst.update_status(val_type='scene_saved', status=scene_status)
-    scene_data.gui_inst.update_script_output(message=message)
-
-    # Checking if there are referenced files in the scene
-    ref_status, message = validate.referenced_data_check(scene_data)
-    scene_data.gui_inst.update_status(val_type='referenced_data', status=ref_status)
-    scene_data.gui_inst.update_script_output(message=message)
-
-    if scene_status == 'pass' and ref_status == 'pass':
-        return True
-    else:
-        return False
+    statuses = run_checks(scene_data, SCENE_CHECKS)
+
+    return all(status == 'pass' for status in statuses.values())
 
 
 def character_validation(scene_data, mode=static.VALIDATION_NORMAL):
@@ -59,96 +244,15 @@ def character_validation(scene_data, mode=static.VALIDATION_NORMAL):
         mode (str): The mode the validation is running on. It can be either static.VALIDATION_NORMAL
             or static.VALIDATION_USD
     """
-    # Checking if "GEO" group exists
-    geo_status, message = validate.geo_group_check(scene_data)
-    scene_data.gui_inst.update_status(val_type='geo_check', status=geo_status)
-    scene_data.gui_inst.update_script_output(message=message)
-
-    if geo_status == 'pass':
-        # Checking the rig
-        rig_status, message = validate.rig_check(scene_data, mode=mode)
-        scene_data.gui_inst.update_status(val_type='rig_check', status=rig_status)
-        scene_data.gui_inst.update_script_output(message=message)
-
-        if rig_status in ['pass', 'warning_fix']:
-            # Checking if rig group exists and is named correctly
-            rig_grop_stat, message = validate.rig_group_check(scene_data)
-            scene_data.gui_inst.update_status(val_type='rig_group_check', status=rig_grop_stat)
-            scene_data.gui_inst.update_script_output(message=message)
-
-            # Checking if geometries have construction history
-            status, message = validate.history_check(scene_data)
-            scene_data.gui_inst.update_status(val_type='history_check', status=status)
-            scene_data.gui_inst.update_script_output(message=message)
-
-            # Checking if all grp is ok
-            all_status, all_message = validate.all_group_check(scene_data, mode=mode)
-            scene_data.gui_inst.update_status(val_type='all_group_check', status=all_status)
-            scene_data.gui_inst.update_script_output(message=all_message)
-
-            if rig_grop_stat == 'pass':
-                # Checking poly count
-                status, message = validate.poly_count_check(scene_data)
-                scene_data.gui_inst.update_status(val_type='poly_count_check', status=status)
-                scene_data.gui_inst.update_script_output(message=message)
-
-                # Checking retargeting data
-                status, message = validate.retargeting_check(scene_data)
-                scene_data.gui_inst.update_status(val_type='retargeting_check', status=status)
-                scene_data.gui_inst.update_script_output(message=message)
-
-                # Checking existance of IK joint chains
-                ik_status, message = validate.rig_ik_check(scene_data)
-                scene_data.gui_inst.update_status(val_type='ik_check', status=ik_status)
-                scene_data.gui_inst.update_script_output(message=message)
-
-                # Checking face setup
-                status, message = validate.face_check(scene_data=scene_data)
-                scene_data.gui_inst.update_status(val_type='face_check', status=status)
-                scene_data.gui_inst.update_script_output(message=message)
-
-                # Checking material types
-                mat_status, message = validate.materials_check(scene_data)
-                scene_data.gui_inst.update_status(val_type='material_type_check', status=mat_status)
-                scene_data.gui_inst.update_script_output(message=message)
-
-                if mat_status == 'pass':
-                    # Checking if naming of objects isn't too long
-                    status, message = validate.naming_check(scene_data)
-                    scene_data.gui_inst.update_status(val_type='naming_check', status=status)
-                    scene_data.gui_inst.update_script_output(message=message)
-
-                    # Checking material incoming connections
-                    status, message = validate.material_connections_check(scene_data)
-                    scene_data.gui_inst.update_status(val_type='material_connections_check', status=status)
-                    scene_data.gui_inst.update_script_output(message=message)
-
-                    # Checking if there are empty file nodes
-                    status, message = validate.empty_file_nodes_check(scene_data)
-                    scene_data.gui_inst.update_status(val_type='file_nodes_check', status=status)
-                    scene_data.gui_inst.update_script_output(message=message)
-
-                    # Checking if there are missing textures
-                    status, message = validate.textures_check(scene_data)
-                    scene_data.gui_inst.update_status(val_type='textures_check', status=status)
-                    scene_data.gui_inst.update_script_output(message=message)
-
-                    # Checking the xGen materials
-                    status, message = validate.groom_materials_check(scene_data)
-                    scene_data.gui_inst.update_status(val_type='xGen_check', status=status)
-                    scene_data.gui_inst.update_script_output(message=message)
-
-                    scene_data.gui_inst.enable_export()
-
-                else:
-                    utilities.abort_validation(scene_data)
-            else:
-                utilities.abort_validation(scene_data)
-        else:
-            utilities.abort_validation(scene_data)
-    else:
+    try:
+        run_checks(scene_data, CHARACTER_CHECKS, mode=mode)
+
+    except ValidationAborted:
         utilities.abort_validation(scene_data)
 
+    else:
+        scene_data.gui_inst.enable_export()
+
 
 def validation_run(scene_data, mode=static.VALIDATION_NORMAL):
     """Runs the full validation process.
@@ -157,21 +261,30 @@ def validation_run(scene_data, mode=static.VALIDATION_NORMAL):
         mode (str): The mode the validation is running on. It can be either static.VALIDATION_NORMAL
             or static.VALIDATION_USD
     """
-    scene_data.gui_inst.update_script_output(
-        message='============================================================================='
+    gui_inst = scene_data.gui_inst
+    # all the messages of the run are written at once when it ends
+    gui_inst.begin_output_batch()
+    gui_inst.update_script_outputs(
+        [
+            '=============================================================================',
+            '>>> Starting scene and character validation...',
+        ]
     )
-    scene_data.gui_inst.update_script_output(message='>>> Starting scene and character validation...')
 
-    utilities.reset_validation_data(scene_data)
+    try:
+        utilities.reset_validation_data(scene_data)
 
+        # checks only query the scene, so there is no need to redraw it meanwhile. The evaluation
+        # manager is left alone, switching it off and on again rebuilds the evaluation graph.
+        with utilities.FastMayaContext(undo_chunk=False, pause_evaluation=False, suspend_refresh=True):
+            scene_validation_status = scene_validation(scene_data)
 
-    scene_validation_status = scene_validation(scene_data)
+            if scene_validation_status:
+                scene_data.collect_data(mode=mode)
+                character_validation(scene_data, mode=mode)
 
-    if scene_validation_status:
-        scene_data.collect_data()
-        # since metadata was reset, we need to add this value coming from the ui
-        scene_data.metadata_json['usd'] = mode == static.VALIDATION_USD
-        character_validation(scene_data, mode=mode)
+            else:
+                utilities.abort_validation(scene_data)
 
-    else:
-        utilities.abort_validation(scene_data)
+    finally:
+        gui_inst.flush_output_batch()
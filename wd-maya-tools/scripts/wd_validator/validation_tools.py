@@ -5,19 +5,41 @@
 
 """Module defining the check's messages and most of their logic."""
 
+import collections
 import os
 import importlib
+import itertools
 import maya.cmds as cmds
+import maya.api.OpenMaya as om
 
 from wd_validator import utilities, static
 
-importlib.reload(utilities)
-importlib.reload(static)
+# Reloading is only needed while developing the add-on
+if os.environ.get('WD_VALIDATOR_DEV'):
+    importlib.reload(utilities)
+    importlib.reload(static)
 
 
 # Code should be Python27 compatible
 # pylint: disable=consider-using-f-string
 
+# Node types that can provide textures to a material
+_FILE_NODE_TYPES = frozenset(['file', 'aiImage'])
+
+# Face blendshapes expected by the metadata template, excluding the basis
+_VALID_BLENDSHAPE_NAMES = frozenset(
+    name for name in static.metadata_template['face']['blendshape_names'] if name != 'Basis'
+)
+
+# Extensions of the texture formats that can be exported, as a tuple so str.endswith tests them all at once
+_SUPPORTED_EXTENSIONS = tuple(extension.lower() for extension in static.supported_textures)
+
+# Attributes of each supported material type that can have a texture connected, in the table order
+_TEXTURE_ATTRIBUTES = {
+    material_type: [attr for attr in attributes if attr in static.accepting_textures]
+    for material_type, attributes in static.material_attributes.items()
+}
+
 
 def scene_saved_check(scene_data):
     """Check if the current scene exists on disk. The status for this check is stored
@@ -84,7 +106,8 @@ def geo_group_check(scene_data):
     geo_group = scene_data.geo_group or []
 
     # keeping existing group
-    valid_geo_groups = [grp for grp in geo_group if grp and cmds.objExists(grp)]
+    existing_groups = utilities.get_existing_nodes([grp for grp in geo_group if grp])
+    valid_geo_groups = [grp for grp in geo_group if grp in existing_groups]
 
     if not valid_geo_groups:
         status = 'fail'
@@ -109,9 +132,8 @@ def geo_group_check(scene_data):
         return status, message
 
     # check group does not have any transformation
-    identity_matrix = [1.0, 0.0, 0.0, 0.0, 0.0, 1.0, 0.0, 0.0, 0.0, 0.0, 1.0, 0.0, 0.0, 0.0, 0.0, 1.0]
-    local_matrix = cmds.xform(valid_geo_groups[0], q=1, m=1, os=1)
-    if local_matrix != identity_matrix:
+    local_identity, world_identity = utilities.get_identity_transform_status(valid_geo_groups[0])
+    if not local_identity:
         status = 'fail'
         message = [
             '>>> [ERROR] The \"GEO\" group is transformed (has translate, rotate or scale values) - FAIL.',
@@ -122,8 +144,7 @@ def geo_group_check(scene_data):
         scene_data.validation_data['geo_check'] = status
         return status, message
 
-    world_matrix = cmds.xform(valid_geo_groups[0], q=1, m=1, ws=1)
-    if world_matrix != identity_matrix:
+    if not world_identity:
         status = 'fail'
         message = [
             '>>> [ERROR] The \"GEO\" group parent is transformed (has translate, rotate or scale values) - FAIL.',
@@ -134,10 +155,27 @@ def geo_group_check(scene_data):
         scene_data.validation_data['geo_check'] = status
         return status, message
 
+    # check group content before walking the meshes, an empty group fails without the traversal
+    group_contents = scene_data.get_descendants(valid_geo_groups)
+    if not group_contents:
+        status = 'fail'
+        message = [
+            '>>> [ERROR] The \"GEO\" group is empty - FAIL.',
+            '  > Make sure that all character geometries are inside the \"GEO\" group.',
+        ]
+
+        scene_data.validation_data['geo_check'] = status
+        return status, message
+
     # check geometries transforms TODO:
-    meshes = cmds.listRelatives(valid_geo_groups, allDescendents=True, path=True, type='mesh') or []
-    mesh_trfs = list(set(cmds.listRelatives(meshes, parent=True, path=True) or []))
-    transformed_meshes = [mt for mt in mesh_trfs if  cmds.xform(mt, query=1, matrix=1, objectSpace=1) != identity_matrix]
+    # the mesh transforms and their local matrices are read in a single walk of the GEO group
+    transformed_meshes = [
+        dag_path.partialPathName()
+        for dag_path in utilities.get_mesh_transforms(valid_geo_groups[0])
+        if not om.MFnTransform(dag_path).transformation().asMatrix().isEquivalent(
+            om.MMatrix.kIdentity, static.IDENTITY_TOLERANCE
+        )
+    ]
     if transformed_meshes:
         status = 'fail'
         geo_list = '  >   - ' + '\n  >   - '.join(transformed_meshes)
@@ -153,7 +191,7 @@ def geo_group_check(scene_data):
         return status, message
 
     # check no animation
-    animation_curves_found = utilities.get_animation_curves_connected_to_group(*valid_geo_groups)
+    animation_curves_found = utilities.get_animation_curves_connected_to_nodes(valid_geo_groups + group_contents)
     if animation_curves_found:
         status = 'fix'
         message = [
@@ -166,18 +204,6 @@ def geo_group_check(scene_data):
         scene_data.validation_data['geo_check'] = status
         return status, message
 
-    # check group content
-    group_contents = cmds.listRelatives(valid_geo_groups, ad=True) or None
-    if not group_contents:
-        status = 'fail'
-        message = [
-            '>>> [ERROR] The \"GEO\" group is empty - FAIL.',
-            '  > Make sure that all character geometries are inside the \"GEO\" group.',
-        ]
-
-        scene_data.validation_data['geo_check'] = status
-        return status, message
-
     status = 'pass'
     message = '>>> Checking if the \"GEO\" group exists - PASS.'
     scene_data.validation_data['geo_check'] = status
@@ -208,9 +234,8 @@ def rig_group_check(scene_data):
         return status, message
 
     # check group transformation is the identity matrix
-    identity_matrix = [1.0, 0.0, 0.0, 0.0, 0.0, 1.0, 0.0, 0.0, 0.0, 0.0, 1.0, 0.0, 0.0, 0.0, 0.0, 1.0]
-    local_matrix = cmds.xform(rig_group, q=1, m=1, os=1)
-    if local_matrix != identity_matrix:
+    local_identity, world_identity = utilities.get_identity_transform_status(rig_group)
+    if not local_identity:
         status = 'fail'
         message = ['>>> [ERROR] Rig group suffix check - FAIL.',
             '  > The "{}" group is transformed (has translate, rotate or scale values)'.format(scene_data.rig_group),
@@ -222,8 +247,7 @@ def rig_group_check(scene_data):
         return status, message
 
     # check group parent does not have any transformation
-    world_matrix = cmds.xform(rig_group, q=1, m=1, ws=1)
-    if world_matrix != identity_matrix:
+    if not world_identity:
         status = 'fail'
         message = ['>>> [ERROR] Rig group suffix check - FAIL.',
             '  > The "{}" parents are transformed (has translate, rotate or scale values)'.format(scene_data.rig_group),
@@ -288,7 +312,11 @@ def all_group_check(scene_data, mode=static.VALIDATION_NORMAL):
     # check there is not more than a group scene_data.rig_group scene_data.geo_group
     geo_parent_parent = cmds.listRelatives(geo_parent, p=1, pa=1)
     if geo_parent_parent:
-        paths = ', '.join(cmds.ls(geo_parent_parent, l=1)[0].split('|')[1:])
+        # every ancestor in the long paths has to go, listed once even if the parent is instanced
+        groups_to_remove = dict.fromkeys(
+            group for long_path in cmds.ls(geo_parent_parent, l=1) or [] for group in long_path[1:].split('|')
+        )
+        paths = ', '.join(groups_to_remove)
         status = 'fix'
         message = [
             '>>> [ERROR] Optional all group - FAIL.',
@@ -299,9 +327,8 @@ def all_group_check(scene_data, mode=static.VALIDATION_NORMAL):
         return status, message
 
     # check group transformation is the identity matrix
-    identity_matrix = [1.0, 0.0, 0.0, 0.0, 0.0, 1.0, 0.0, 0.0, 0.0, 0.0, 1.0, 0.0, 0.0, 0.0, 0.0, 1.0]
-    local_matrix = cmds.xform(geo_parent, q=1, m=1, os=1)
-    if local_matrix != identity_matrix:
+    local_identity, _ = utilities.get_identity_transform_status(geo_parent[0])
+    if not local_identity:
         status = 'fix'
         message = [
             '>>> [ERROR] Optional all group - FAIL.',
@@ -347,8 +374,13 @@ def poly_count_check(scene_data, poly_limit=1500000):
     """
     polycount = 0
 
-    for mesh in scene_data.all_meshes:
-        polycount += cmds.polyEvaluate(mesh, face=True)
+    # the face count is read from the mesh function set instead of one polyEvaluate per mesh
+    for dag_path in utilities.get_dag_paths(scene_data.all_meshes):
+        polycount += om.MFnMesh(dag_path).numPolygons
+
+        # the total is not reported, so there is no need to count past the limit
+        if polycount > poly_limit:
+            break
 
     if polycount > poly_limit:
         status = 'fail'
@@ -396,13 +428,7 @@ def mesh_skinning_check(scene_data):
     missing_skin = []
 
     for mesh in scene_data.all_meshes:
-        mesh_history = cmds.listHistory(mesh)
-
-        for node in mesh_history:
-            if cmds.nodeType(node) == 'skinCluster':
-                break
-
-        else:
+        if not utilities.has_upstream_node(mesh, om.MFn.kSkinClusterFilter):
             missing_skin.append(mesh)
 
     return missing_skin
@@ -424,11 +450,11 @@ def rig_check(scene_data, mode=static.VALIDATION_NORMAL):
     if not character_rig or not cmds.objExists(character_rig):
         status = 'fail'
 
-        # Check if any rig exists in the scene
-        joints = cmds.ls(type='joint')
+        # Check if any rig exists in the scene, listing a single joint is enough
+        has_any_joint = bool(cmds.ls(type='joint', head=1))
         message = ['>>> [ERROR] Character rig check - FAIL.']
 
-        if not joints:
+        if not has_any_joint:
             message.append('  > No rig found.')
 
         message.append('  > Make sure that the character is rigged and skinned to the rig.')
@@ -463,14 +489,15 @@ def rig_check(scene_data, mode=static.VALIDATION_NORMAL):
         scene_data.validation_data['rig_check'] = status
         return status, message
 
-    meshes_in_rig = cmds.listRelatives(scene_data.rig_selection, ad=True, pa=True, type='mesh')
+    meshes_in_rig = scene_data.get_descendants([scene_data.rig_selection], node_type='mesh')
     if meshes_in_rig:
 
         status = 'fail'
         message = ['>>> [ERROR] Character rig check - FAIL.',]
 
-        for mesh in meshes_in_rig:
-            message.append('  > Mesh: \"{}\" is in the rig hierarchy.'.format(cmds.listRelatives(mesh, parent=True, pa=True)[0]))
+        # one query for all the mesh transforms, each transform is listed once
+        for mesh_transform in cmds.listRelatives(meshes_in_rig, parent=True, pa=True) or []:
+            message.append('  > Mesh: \"{}\" is in the rig hierarchy.'.format(mesh_transform))
 
         message += [
             '  > All meshes must be placed inside the \"GEO\" group.',
@@ -485,8 +512,7 @@ def rig_check(scene_data, mode=static.VALIDATION_NORMAL):
         status = 'fail'
         message = ['>>> [ERROR] Character rig check - FAIL.']
 
-        for mesh in skinning_check:
-            message.append('  > Mesh \"{}\" is not skinned.'.format(mesh.split('|')[-1]))
+        message.extend('  > Mesh \"{}\" is not skinned.'.format(mesh.rpartition('|')[2]) for mesh in skinning_check)
 
         message.append('  > All meshes must be skinned to the rig!')
 
@@ -496,7 +522,9 @@ def rig_check(scene_data, mode=static.VALIDATION_NORMAL):
     # check joints are not duplicated in names
     joints = cmds.listRelatives(character_rig, allDescendents=True, type='joint') or []
     joints += [character_rig]
-    duplicated_joint_names = [j for j in joints if len(cmds.ls(j)) > 1]
+    # a single ls lists every node matching the joint names, repeated short names are duplicates
+    name_counts = collections.Counter(node.rpartition('|')[2] for node in cmds.ls(joints))
+    duplicated_joint_names = [j for j in joints if name_counts[j.rpartition('|')[2]] > 1]
     if duplicated_joint_names:
         status = 'fail'
         message = ['>>> [ERROR] Character rig check - FAIL.']
@@ -524,7 +552,9 @@ def rig_check(scene_data, mode=static.VALIDATION_NORMAL):
             return status, message
 
     # check no animation
-    animation_curves_found = utilities.get_animation_curves_connected_to_group(character_rig)
+    animation_curves_found = utilities.get_animation_curves_connected_to_nodes(
+        [character_rig] + scene_data.get_descendants([character_rig])
+    )
     if animation_curves_found:
         status = 'warning_fix'
         message = ['>>> [WARNING] Character rig check - optional FIX.',
@@ -553,25 +583,38 @@ def retargeting_check(scene_data):
         tuple(str, str): the result of the check, first status (fail|pass) the then the
             message explaining the status.
     """
-    if utilities.check_data('rig_mapping'):
-        all_bones = utilities.read_data('rig_mapping')
+    # read fresh since the joint mapping window runs this check right after editing the mapping,
+    # the later checks of the same validation run share it through scene_data.get_rig_mapping
+    all_bones = utilities.read_data('rig_mapping')
+    scene_data.rig_mapping = all_bones
+
+    if all_bones is not None:
+        bones_removed = False
+        bones_missing = False
+        existing_bones = utilities.get_existing_nodes([bone for bone in all_bones.values() if bone])
 
         # Check for changes
         for key, bone in all_bones.items():
-            if bone:
-                if cmds.objExists(bone) is False:
+            if bone is None:
+                bones_missing = True
+
+            elif bone:
+                if bone not in existing_bones:
                     all_bones[key] = None
+                    bones_removed = True
+                    bones_missing = True
                     try:
                         scene_data.retarget_gui_inst.clear_bone(key=key)
                     except Exception:
                         print('Joint mapping window closed.')
 
         # Save changes
-        utilities.write_data('rig_mapping', all_bones)
+        if bones_removed:
+            utilities.write_data('rig_mapping', all_bones)
 
         if all_bones['Hips']:
             # check all bones for warning
-            if None in all_bones.values():
+            if bones_missing:
                 status = 'warning'
                 message = [
                     '>>> [WARNING] Pose bones missing! Missing bones may negatively impact animation quality.',
@@ -609,7 +652,8 @@ def rig_ik_check(scene_data):
             message explaining the status.
     """
 
-    all_bones = utilities.read_data('rig_mapping')
+    # the joint mapping was already read, and cleaned up, by retargeting_check
+    all_bones = scene_data.get_rig_mapping()
 
     # Check if any bones are mapped
     if not all_bones:
@@ -621,11 +665,23 @@ def rig_ik_check(scene_data):
         ]
         return status, message
 
-    # Check if all joint pairs are in the same joint hierarchy.
+    bone_paths = {}
+
+    def _long_paths(bone):
+        # joints shared by several pairs are only looked up once
+        if bone not in bone_paths:
+            bone_paths[bone] = cmds.ls(bone, long=True) if bone else []
+        return bone_paths[bone]
+
+    # Check if all joint pairs are in the same joint hierarchy, the end joint of the
+    # chain is under the start joint if the start joint path is a prefix of its path.
     for pair_dict in static.ik_pairs.values():
         chain_start, chain_end = pair_dict['keys']
-        all_children = cmds.listRelatives(all_bones[chain_start], allDescendents=True, type='joint', pa=1) or []
-        pair_dict['status'] = all_bones[chain_end] in all_children
+        pair_dict['status'] = any(
+            end_path.startswith(start_path + '|')
+            for start_path in _long_paths(all_bones[chain_start])
+            for end_path in _long_paths(all_bones[chain_end])
+        )
 
     # Check the IK data and generate status and messages to be returned.
     status = 'pass'
@@ -686,17 +742,18 @@ def face_check(scene_data, face_geo=None):
     error_messages = []
     warn_messages = []
 
-    # Exclude unused blendshapes and basis
-    excluded_shapes = ['Basis']
-    valid_blendshape_names = [n for n in scene_data.metadata_json['face']['blendshape_names'] if n not in excluded_shapes]
-
     # Naming check
     if not face_geo.endswith('FACE'):
         error_messages.append('  > Wrong face mesh name! Main face mesh name does not end with the tag "FACE"!')
 
     # Blendshapes check
-    face_history = cmds.listHistory(face_geo)
-    face_blendshape_node = cmds.ls(face_history, type='blendShape')
+    face_blendshape_node = []
+    face_shapes = cmds.listRelatives(face_geo, shapes=True, noIntermediate=True, fullPath=True) or []
+
+    for face_shape in face_shapes:
+        for bshn in utilities.get_upstream_nodes(face_shape, om.MFn.kBlendShape):
+            if bshn not in face_blendshape_node:
+                face_blendshape_node.append(bshn)
 
     if len(face_blendshape_node) > 1:
         warn_msg = [
@@ -710,7 +767,7 @@ def face_check(scene_data, face_geo=None):
 
     # clear previous blendshapes so we keep only the ones in current blendshape nodes
     scene_data.face_blendshapes = []
-    existing_blendshapes = []
+    existing_blendshapes = set()
 
     for bshn in face_blendshape_node:
         blendshape_names = cmds.listAttr(bshn + '.w', m=True)
@@ -720,7 +777,7 @@ def face_check(scene_data, face_geo=None):
             continue
 
         for bs_name in blendshape_names:
-            if bs_name not in valid_blendshape_names:
+            if bs_name not in _VALID_BLENDSHAPE_NAMES:
                 continue
 
             if bs_name in existing_blendshapes:
@@ -735,7 +792,7 @@ def face_check(scene_data, face_geo=None):
                 continue
 
             scene_data.face_blendshapes.append(bs_name)
-            existing_blendshapes.append(bs_name)
+            existing_blendshapes.add(bs_name)
 
     # asses valid found blendshapes
     if not scene_data.face_blendshapes:
@@ -744,7 +801,7 @@ def face_check(scene_data, face_geo=None):
         ]
     else:
         # check for missing shapes from the full list
-        if len(scene_data.face_blendshapes) < len(valid_blendshape_names):
+        if len(scene_data.face_blendshapes) < len(_VALID_BLENDSHAPE_NAMES):
             warn_msg = [
                 '  > Some face blendshapes missing! Missing blendshapes may negatively impact facial animation quality.',
                 '  > Please make sure missing blendshapes are left out intentionally.',
@@ -754,12 +811,11 @@ def face_check(scene_data, face_geo=None):
     # Make sure that there are no other geometries with "FACE" suffix.
     all_face_geo = []
     if scene_data.all_meshes:
-        for mesh in scene_data.all_meshes:
-            if not cmds.objExists(mesh):
-                continue
-            transform = cmds.listRelatives(mesh, parent=True, fullPath=True)[0]
-            if transform.endswith('FACE'):
-                all_face_geo.append(transform)
+        existing_meshes = utilities.get_existing_nodes(scene_data.all_meshes)
+        existing_transforms = (
+            scene_data.mesh_transforms[mesh] for mesh in scene_data.all_meshes if mesh in existing_meshes
+        )
+        all_face_geo = [transform for transform in existing_transforms if transform.endswith('FACE')]
 
     if len(all_face_geo) > 1:
         error_messages += ['  > Multiple main face meshes!', '  > More than one mesh with the tag \"FACE\" detected.']
@@ -784,6 +840,62 @@ def face_check(scene_data, face_geo=None):
     return status, message
 
 
+def _get_material_connections_messages(scene_data, material, material_type):
+    """Goes through the texture accepting attributes of a supported material, storing the
+    file nodes connected to them in scene_data.file_nodes.
+    Args:
+        scene_data (CollectExportData): the object with the scene data already initialized.
+        material (str): the name of the material.
+        material_type (str): the type of the material, a key in static.material_attributes.
+    Returns:
+        list[str]: the messages for each unsupported connection found.
+    """
+    all_messages = []
+
+    texture_attributes = _TEXTURE_ATTRIBUTES[material_type]
+    input_connections = utilities.get_source_nodes(material, texture_attributes)
+
+    for attr in texture_attributes:
+        input_connection = input_connections[attr]
+
+        if input_connection:
+            connection_type = scene_data.node_type(input_connection)
+
+            if attr != 'normalCamera':
+                if connection_type in _FILE_NODE_TYPES:
+                    scene_data.file_nodes[input_connection] = ''
+
+                else:
+                    all_messages.append(
+                        '  > Connection to \"{m}.{a}\" is not supported.'.format(m=material, a=attr)
+                    )
+
+            else:
+                if connection_type in static.supported_bump_nodes:
+                    bump_node_data = static.supported_bump_nodes[connection_type]
+                    bump_input = utilities.get_source_nodes(
+                        input_connection, [bump_node_data['input_attr']]
+                    )[bump_node_data['input_attr']]
+
+                    if bump_input:
+                        input_type = scene_data.node_type(bump_input)
+
+                        if input_type in _FILE_NODE_TYPES:
+                            scene_data.file_nodes[bump_input] = ''
+
+                        else:
+                            all_messages.append(
+                                '  > Connection to \"{m}\" bump node \"{b}.{a}\" is not supported.'.format(
+                                    m=material, a=bump_node_data['input_attr'], b=input_connection
+                                )
+                            )
+
+                else:
+                    all_messages.append('  > Bump input to \"{m}\" is not supported.'.format(m=material))
+
+    return all_messages
+
+
 def materials_check(scene_data):
     """Collects and stores in scene_data all supported materials assigned to meshes
     stored in scene_data. If any mesh does not have a supported material assigned,
@@ -794,26 +906,41 @@ def materials_check(scene_data):
     Returns:
         tuple(str, str): the result of the check, first status (fail|pass) the then the
             message explaining the status.
+    Notes:
+        The incoming connections of each supported material are resolved in the same pass,
+            their results are reported later by material_connections_check.
     """
-    checked_materials = []
+    checked_materials = set()
     all_messages = []
+    connections_messages = []
     scene_data.materials = []
 
+    mesh_shading_groups = utilities.get_shading_groups(scene_data.all_meshes)
+    # shading groups are usually shared by many meshes, their material is only read once
+    shading_group_materials = {}
+
     for mesh in scene_data.all_meshes:
-        shading_groups = cmds.listConnections(mesh, type='shadingEngine') or None
+        shading_groups = mesh_shading_groups[mesh]
 
         if shading_groups:
             for shading_group in shading_groups:
-                material = cmds.listConnections('%s.surfaceShader' % shading_group) or [None]
-                material = material[0]
+                if shading_group not in shading_group_materials:
+                    shading_group_materials[shading_group] = utilities.get_source_nodes(
+                        shading_group, ['surfaceShader']
+                    )['surfaceShader']
+
+                material = shading_group_materials[shading_group]
 
                 if material:
                     if material not in checked_materials:
-                        checked_materials.append(material)
-                        material_type = cmds.nodeType(material)
+                        checked_materials.add(material)
+                        material_type = scene_data.node_type(material)
 
                         if material_type in static.material_attributes:
                             scene_data.materials.append(material)
+                            connections_messages += _get_material_connections_messages(
+                                scene_data, material, material_type
+                            )
 
                         else:
                             all_messages.append(
@@ -832,6 +959,8 @@ def materials_check(scene_data):
         else:
             all_messages.append('  > Mesh \"{m}\" is missing a shading group and a material.'.format(m=mesh))
 
+    scene_data.material_connections_messages = connections_messages
+
     if all_messages:
         status = 'fail'
         message = ['>>> [ERROR] Character materials type check - FAIL.']
@@ -856,55 +985,20 @@ def material_connections_check(scene_data):
         tuple(str, str): the result of the check, first status (fail|pass) the then the
             message explaining the status.
     Notes:
+        The connections are resolved by materials_check, they are only resolved here if that
+            check did not run since the scene data was collected.
         Values for keys on scene_data.file_nodes are left as empty strings because they
             will be filled with the resolved textures on empty_file_nodes_check function.
     """
-    all_messages = []
-
-    for material in scene_data.materials:
-        material_type = cmds.nodeType(material)
-
-        for attr in static.material_attributes[material_type]:
-            if attr in static.accepting_textures:
-                input_connection = cmds.listConnections('{m}.{a}'.format(m=material, a=attr)) or None
-
-                if input_connection:
-                    connection_type = cmds.nodeType(input_connection[0])
-
-                    if attr != 'normalCamera':
-                        if connection_type == 'file' or connection_type == 'aiImage':
-                            scene_data.file_nodes[input_connection[0]] = ''
-
-                        else:
-                            all_messages.append(
-                                '  > Connection to \"{m}.{a}\" is not supported.'.format(m=material, a=attr)
-                            )
-
-                    else:
-                        if connection_type in static.supported_bump_nodes:
-                            bump_node_data = static.supported_bump_nodes[connection_type]
-                            bump_input = (
-                                cmds.listConnections(
-                                    '{n}.{at}'.format(n=input_connection[0], at=bump_node_data['input_attr'])
-                                )
-                                or None
-                            )
-
-                            if bump_input:
-                                input_type = cmds.nodeType(bump_input[0])
-
-                                if input_type == 'file' or input_type == 'aiImage':
-                                    scene_data.file_nodes[bump_input[0]] = ''
+    all_messages = scene_data.material_connections_messages
 
-                                else:
-                                    all_messages.append(
-                                        '  > Connection to \"{m}\" bump node \"{b}.{a}\" is not supported.'.format(
-                                            m=material, a=bump_node_data['input_attr'], b=input_connection[0]
-                                        )
-                                    )
+    if all_messages is None:
+        all_messages = []
 
-                        else:
-                            all_messages.append('  > Bump input to \"{m}\" is not supported.'.format(m=material))
+        for material in scene_data.materials:
+            all_messages += _get_material_connections_messages(
+                scene_data, material, scene_data.node_type(material)
+            )
 
     if all_messages:
         status = 'fail'
@@ -932,16 +1026,25 @@ def empty_file_nodes_check(scene_data):
     Notes:
         Whether or not the assigned textures exist on disk will be checked in textures_check
             function.
+        The resolved textures are stored in scene_data.file_nodes, and the inverse mapping
+            (texture to file nodes) in scene_data.texture_file_nodes, so that later checks
+            and the export do not need to resolve them again.
     """
     all_messages = []
+    scene_data.texture_file_nodes = {}
 
     if scene_data.file_nodes:
-        for file_node in scene_data.file_nodes.keys():
-            texture_path = utilities.get_texture_path(file_node)
+        texture_paths = utilities.get_texture_paths(list(scene_data.file_nodes.keys()))
+
+        for file_node, texture_path in texture_paths.items():
             scene_data.file_nodes[file_node] = texture_path
 
             if not texture_path:
                 all_messages.append('  > File node \"{}\" is missing a texture input.'.format(file_node))
+                continue
+
+            for texture in texture_path:
+                scene_data.texture_file_nodes.setdefault(texture, []).append(file_node)
 
     if all_messages:
         status = 'fix'
@@ -971,17 +1074,30 @@ def textures_check(scene_data):
 
     supported_extensions_label = ", ".join(static.supported_textures)
 
+    # textures shared by several file nodes are only looked up on disk once
+    missing_textures = set()
+    unsupported_textures = set()
+
+    existing_textures = utilities.get_existing_files(scene_data.texture_file_nodes)
+
+    for texture in scene_data.texture_file_nodes:
+        if texture not in existing_textures:
+            missing_textures.add(texture)
+
+        if not texture.lower().endswith(_SUPPORTED_EXTENSIONS):
+            unsupported_textures.add(texture)
+
     for file_node, texture_path in scene_data.file_nodes.items():
         if texture_path:
             for texture in texture_path:
-                if not os.path.exists(texture):
+                if texture in missing_textures:
                     all_messages.append(
                         '  > File node \"{fn}\" can\'t access the following texture: "{tex}"'.format(
                             fn=file_node, tex=texture
                         )
                     )
 
-                if os.path.splitext(texture)[-1].lower() not in static.supported_textures:
+                if texture in unsupported_textures:
                     all_messages.append(
                         '  > Format for texture \"{}\" is not supported.'.format(os.path.split(texture)[-1])
                     )
@@ -1011,26 +1127,21 @@ def get_xgen_descriptions(scene_data):
     Returns:
         list: A list of all xGen descriptions that are connected to the character.
     """
-    descriptions = cmds.ls(type='xgmPalette')
+    descriptions = scene_data.scene_nodes.get('xgmPalette', [])
     valid_descriptions = []
 
     for description in descriptions:
-        patch = cmds.listRelatives(description, ad=True, type='xgmSubdPatch') or None
+        patch = cmds.listRelatives(description, ad=True, type='xgmSubdPatch')
 
         if not patch:
             continue
 
-        patch_history = cmds.ls(cmds.listHistory(patch[0]), l=True)
-
-        for node in patch_history:
-            if cmds.nodeType(node) != 'mesh':
-                continue
-
-            if node not in scene_data.all_meshes:
-                continue
+        # the history is filtered down to meshes by ls itself instead of typing each node
+        patch_history = cmds.listHistory(patch[0]) or []
+        history_meshes = cmds.ls(patch_history, type='mesh', l=True) if patch_history else []
 
+        if scene_data.all_meshes_set.intersection(history_meshes):
             valid_descriptions.append(description)
-            break
 
     return valid_descriptions
 
@@ -1048,25 +1159,38 @@ def groom_materials_check(scene_data):
         tuple(str, str): the result of the check, first status (skip|warning|pass) the then the
             message explaining the status.
     """
-    ig_spline_bases = cmds.ls(type='xgmSplineBase') or None
+    if not scene_data.xgen_loaded:
+        status = 'skip'
+        message = '>>> No xGen found on the character - Skipping.'
+
+        scene_data.validation_data['xGen_check'] = status
+        return status, message
+
+    ig_spline_bases = scene_data.scene_nodes.get('xgmSplineBase')
     messages = []
 
     if ig_spline_bases:
         for spline_base in ig_spline_bases:
             interactive_groom_shape = utilities.get_spline_description(spline_base)
             interactive_groom = cmds.listRelatives(interactive_groom_shape, parent=True)[0]
-            interactive_groom_sg = (
-                cmds.listConnections('{}.instObjGroups'.format(interactive_groom_shape), type='shadingEngine')
-                or None
+            interactive_groom_sg = cmds.listConnections(
+                '{}.instObjGroups'.format(interactive_groom_shape),
+                type='shadingEngine',
+                source=False,
+                destination=True,
+            )
+            material = (
+                utilities.get_source_nodes(interactive_groom_sg[0], ['surfaceShader'])['surfaceShader']
+                if interactive_groom_sg
+                else None
             )
-            material = cmds.listConnections('{}.surfaceShader'.format(interactive_groom_sg[0])) or None
 
             if material:
-                material_type = cmds.objectType(material[0])
+                material_type = scene_data.node_type(material)
 
                 if material_type != 'aiStandardHair':
                     msg = '  > Material \"{}\" is not supported. Only \"aiStandardHair\" materials are supported.'
-                    messages.append(msg.format(material[0]))
+                    messages.append(msg.format(material))
             else:
                 msg = '  > \"{}\" has no material assigned. Make sure that all xGen descriptions '
                 msg += 'have \"aiStandardHair\" assigned to them."'
@@ -1108,12 +1232,12 @@ def history_check(scene_data):
     all_messages = []
 
     for mesh in scene_data.all_meshes:
-        mesh_history = utilities.get_pre_skin_history(mesh)
+        mesh_history = utilities.get_pre_skin_history(mesh, show_type=True)
 
         if mesh_history:
-            for node in mesh_history:
-                if cmds.nodeType(node, inherited=True)[0] in static.history_nodes:
-                    all_messages.append('  > Mesh \"{}\" has construction history!'.format(mesh.split('|')[-1]))
+            for _, node_type in mesh_history:
+                if utilities.get_base_node_type(node_type) in static.history_nodes:
+                    all_messages.append('  > Mesh \"{}\" has construction history!'.format(mesh.rpartition('|')[2]))
                     scene_data.meshes_with_history.append(mesh)
                     break
 
@@ -1140,18 +1264,22 @@ def naming_check(scene_data):
         tuple(str, str): the result of the check, first status (fail|pass) the then the
             message explaining the status.
     """
-    all_messages = []
-
-    object_list = scene_data.geo_group + scene_data.all_meshes + scene_data.blendshapes + scene_data.materials
-    object_list.append(scene_data.rig_group)
-    object_list.append(scene_data.rig_selection)
-    object_list += cmds.listRelatives(scene_data.rig_selection, ad=True)
-
-    for obj in object_list:
-        short_name = obj.split('|')[-1]
-
-        if len(short_name) > static.MAX_NAME_LENGHT:
-            all_messages.append('  > Object \"{}\" has a name that\'s longer than 50 characters.'.format(short_name))
+    # the names are only read once, so the exported objects are chained instead of concatenated
+    object_list = itertools.chain(
+        scene_data.geo_group,
+        scene_data.all_meshes,
+        scene_data.blendshapes,
+        scene_data.materials,
+        [scene_data.rig_group, scene_data.rig_selection],
+        scene_data.get_descendants([scene_data.rig_selection]),
+    )
+
+    short_names = (obj.rpartition('|')[2] for obj in object_list)
+    all_messages = [
+        '  > Object \"{}\" has a name that\'s longer than 50 characters.'.format(short_name)
+        for short_name in short_names
+        if len(short_name) > static.MAX_NAME_LENGHT
+    ]
 
     if all_messages:
         status = 'fail'